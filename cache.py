@@ -0,0 +1,44 @@
+"""
+Bounded in-memory caches shared across worker threads
+"""
+import threading
+from typing import Any, Dict, Hashable
+
+
+class BoundedCache:
+    """
+    Thread-safe dict that evicts its oldest entry once max_size entries are held
+    Inserts and evictions happen under one lock, so concurrent writers can't race
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._data: Dict[Hashable, Any] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            return self._data.get(key, default)
+
+    def put(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            if key not in self._data and len(self._data) >= self.max_size:
+                # Evict the oldest entry
+                self._data.pop(next(iter(self._data)))
+            self._data[key] = value
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            return self._data.pop(key, default)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._data
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
@@ -2,18 +2,22 @@
 Configuration management for AcquireIQ
 """
 import os
+from functools import lru_cache
 from typing import Optional
 
+from dotenv import load_dotenv
+
+
+# Pick up HUNTER_API_KEY etc. from a local .env file (see .env.example)
+load_dotenv()
+
 
 class Settings:
     """Application settings"""
     
     def __init__(self):
-        # API Keys - pre-filled with your Hunter.io key
-        self.hunter_api_key: Optional[str] = os.getenv(
-            "HUNTER_API_KEY", 
-            "00d17a35bfef2423200768ddecf7d27fc9dc9ca6"
-        )
+        # API Keys - set HUNTER_API_KEY in the environment or .env
+        self.hunter_api_key: Optional[str] = os.getenv("HUNTER_API_KEY") or None
         
         # Database
         self.database_url: str = os.getenv("DATABASE_URL", "sqlite:///acquireiq.db")
@@ -26,9 +30,30 @@ class Settings:
         # Hunter.io API endpoints
         self.hunter_base_url: str = "https://api.hunter.io/v2"
         
+        # On-disk Hunter.io response cache (used when requests-cache is installed)
+        # Each API key gets its own file next to this path, so cached responses are never shared across keys
+        self.hunter_cache_path: str = os.getenv("HUNTER_CACHE_PATH", "hunter_cache.sqlite")
+        self.domain_search_cache_ttl: int = int(os.getenv("DOMAIN_SEARCH_CACHE_TTL", str(7 * 24 * 3600)))
+        self.verify_cache_ttl: int = int(os.getenv("VERIFY_CACHE_TTL", str(24 * 3600)))
+        
+        # In-memory MX lookup cache used by EmailValidator
+        self.mx_cache_ttl: int = int(os.getenv("MX_CACHE_TTL", "3600"))
+        
+        # Optional sorted, newline-delimited, lowercase list of extra disposable domains
+        self.disposable_domains_path: Optional[str] = os.getenv("DISPOSABLE_DOMAINS_PATH") or None
+        
         # Rate limiting
         self.max_requests_per_minute: int = int(os.getenv("MAX_REQUESTS_PER_MINUTE", "50"))
+        
+        # Concurrency for bulk enrichment
+        self.max_concurrent_requests: int = int(os.getenv("MAX_CONCURRENT_REQUESTS", "8"))
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the process-wide settings, built once on first use"""
+    return Settings()
 
 
 # Global settings instance
-settings = Settings()
+settings = get_settings()
@@ -2,45 +2,81 @@
 CRM Integration and Export Utilities
 """
 import pandas as pd
-from typing import List
+import pyarrow as pa
+import pyarrow.parquet as pq
+from typing import Callable, Dict, Iterator, List
 from models import Lead
 from datetime import datetime
 
 
+# Leads converted per chunk when streaming exports to disk
+EXPORT_CHUNK_SIZE = 5000
+
+# Export columns holding optional numbers with "" placeholders, and their nullable Parquet dtype
+NULLABLE_NUMERIC_COLUMNS = {
+    "Employees": "Int64",
+    "Revenue": "Float64",
+}
+
+
 class CRMIntegration:
     """
     Export enriched leads in CRM-ready formats
     """
     
+    @staticmethod
+    def _field_rows(leads: List[Lead]) -> List[Dict]:
+        """
+        Plain field dicts for each lead, read once per export
+        """
+        return [lead.__dict__ for lead in leads]
+    
+    
+    @staticmethod
+    def _rating_labels(rows: List[Dict]) -> pd.Categorical:
+        """
+        Hot/Warm/Cold rating derived from data quality score
+        """
+        hot, warm = 80, 60
+        labels = [
+            "Hot" if row["data_quality_score"] >= hot else "Warm" if row["data_quality_score"] >= warm else "Cold"
+            for row in rows
+        ]
+        return pd.Categorical(labels, categories=["Hot", "Warm", "Cold"])
+    
+    
     @staticmethod
     def export_salesforce_format(leads: List[Lead]) -> pd.DataFrame:
         """
         Export in Salesforce import format
         """
-        data = []
-        for lead in leads:
-            data.append({
-                "First Name": lead.first_name or "",
-                "Last Name": lead.last_name or "",
-                "Email": lead.email or "",
-                "Title": lead.title or "",
-                "Company": lead.company_name or "",
-                "Website": lead.company_website or "",
-                "Industry": lead.industry or "",
-                "Phone": lead.phone or "",
-                "Street": "",
-                "City": lead.city or "",
-                "State": lead.state or "",
-                "Postal Code": "",
-                "Country": lead.country or "",
-                "Lead Source": lead.data_source or "AcquireIQ",
-                "Lead Status": "New",
-                "Rating": "Hot" if lead.data_quality_score >= 80 else "Warm" if lead.data_quality_score >= 60 else "Cold",
-                "Email Opt Out": "",
-                "Description": f"Quality Score: {lead.data_quality_score}/100, Email Confidence: {lead.email_confidence}%",
-            })
+        rows = CRMIntegration._field_rows(leads)
+        count = len(rows)
+        blanks = [""] * count
         
-        return pd.DataFrame(data)
+        return pd.DataFrame({
+            "First Name": [row["first_name"] or "" for row in rows],
+            "Last Name": [row["last_name"] or "" for row in rows],
+            "Email": [row["email"] or "" for row in rows],
+            "Title": [row["title"] or "" for row in rows],
+            "Company": [row["company_name"] or "" for row in rows],
+            "Website": [row["company_website"] or "" for row in rows],
+            "Industry": [row["industry"] or "" for row in rows],
+            "Phone": [row["phone"] or "" for row in rows],
+            "Street": blanks,
+            "City": [row["city"] or "" for row in rows],
+            "State": [row["state"] or "" for row in rows],
+            "Postal Code": blanks,
+            "Country": pd.Categorical([row["country"] or "" for row in rows]),
+            "Lead Source": [row["data_source"] or "AcquireIQ" for row in rows],
+            "Lead Status": pd.Categorical(["New"] * count),
+            "Rating": CRMIntegration._rating_labels(rows),
+            "Email Opt Out": blanks,
+            "Description": [
+                f"Quality Score: {row['data_quality_score']}/100, Email Confidence: {row['email_confidence']}%"
+                for row in rows
+            ],
+        }, copy=False)
     
     
     @staticmethod
@@ -48,30 +84,29 @@ class CRMIntegration:
         """
         Export in HubSpot import format
         """
-        data = []
-        for lead in leads:
-            data.append({
-                "First Name": lead.first_name or "",
-                "Last Name": lead.last_name or "",
-                "Email": lead.email or "",
-                "Job Title": lead.title or "",
-                "Company Name": lead.company_name or "",
-                "Company Domain Name": lead.company_domain or "",
-                "Website URL": lead.company_website or "",
-                "Industry": lead.industry or "",
-                "Phone Number": lead.phone or "",
-                "City": lead.city or "",
-                "State/Region": lead.state or "",
-                "Country/Region": lead.country or "",
-                "Lead Status": "NEW",
-                "Lifecycle Stage": "lead",
-                "Lead Source": lead.data_source or "AcquireIQ",
-                "AcquireIQ Quality Score": lead.data_quality_score,
-                "AcquireIQ Email Confidence": lead.email_confidence or 0,
-                "AcquireIQ Email Status": lead.email_status or "",
-            })
+        rows = CRMIntegration._field_rows(leads)
+        count = len(rows)
         
-        return pd.DataFrame(data)
+        return pd.DataFrame({
+            "First Name": [row["first_name"] or "" for row in rows],
+            "Last Name": [row["last_name"] or "" for row in rows],
+            "Email": [row["email"] or "" for row in rows],
+            "Job Title": [row["title"] or "" for row in rows],
+            "Company Name": [row["company_name"] or "" for row in rows],
+            "Company Domain Name": [row["company_domain"] or "" for row in rows],
+            "Website URL": [row["company_website"] or "" for row in rows],
+            "Industry": [row["industry"] or "" for row in rows],
+            "Phone Number": [row["phone"] or "" for row in rows],
+            "City": [row["city"] or "" for row in rows],
+            "State/Region": [row["state"] or "" for row in rows],
+            "Country/Region": pd.Categorical([row["country"] or "" for row in rows]),
+            "Lead Status": pd.Categorical(["NEW"] * count),
+            "Lifecycle Stage": pd.Categorical(["lead"] * count),
+            "Lead Source": [row["data_source"] or "AcquireIQ" for row in rows],
+            "AcquireIQ Quality Score": [row["data_quality_score"] for row in rows],
+            "AcquireIQ Email Confidence": [row["email_confidence"] or 0 for row in rows],
+            "AcquireIQ Email Status": [row["email_status"] or "" for row in rows],
+        }, copy=False)
     
     
     @staticmethod
@@ -79,24 +114,23 @@ class CRMIntegration:
         """
         Export in Pipedrive import format
         """
-        data = []
-        for lead in leads:
-            data.append({
-                "Person": lead.full_name or f"{lead.first_name} {lead.last_name}",
-                "Email": lead.email or "",
-                "Phone": lead.phone or "",
-                "Organization": lead.company_name or "",
-                "Job Title": lead.title or "",
-                "Website": lead.company_website or "",
-                "Address": f"{lead.city}, {lead.state}, {lead.country}".strip(", "),
-                "Owner": "",
-                "Visible To": "3",  # Everyone
-                "Label": "Hot" if lead.data_quality_score >= 80 else "Warm" if lead.data_quality_score >= 60 else "Cold",
-                "AcquireIQ Quality Score": lead.data_quality_score,
-                "AcquireIQ Email Confidence": lead.email_confidence or 0,
-            })
+        rows = CRMIntegration._field_rows(leads)
+        count = len(rows)
         
-        return pd.DataFrame(data)
+        return pd.DataFrame({
+            "Person": [row["full_name"] or f"{row['first_name']} {row['last_name']}" for row in rows],
+            "Email": [row["email"] or "" for row in rows],
+            "Phone": [row["phone"] or "" for row in rows],
+            "Organization": [row["company_name"] or "" for row in rows],
+            "Job Title": [row["title"] or "" for row in rows],
+            "Website": [row["company_website"] or "" for row in rows],
+            "Address": [f"{row['city']}, {row['state']}, {row['country']}".strip(", ") for row in rows],
+            "Owner": [""] * count,
+            "Visible To": ["3"] * count,  # Everyone
+            "Label": CRMIntegration._rating_labels(rows),
+            "AcquireIQ Quality Score": [row["data_quality_score"] for row in rows],
+            "AcquireIQ Email Confidence": [row["email_confidence"] or 0 for row in rows],
+        }, copy=False)
     
     
     @staticmethod
@@ -104,32 +138,88 @@ class CRMIntegration:
         """
         Generic CRM format with all available fields
         """
-        data = []
-        for lead in leads:
-            data.append({
-                "ID": lead.id or "",
-                "First Name": lead.first_name or "",
-                "Last Name": lead.last_name or "",
-                "Full Name": lead.full_name or "",
-                "Email": lead.email or "",
-                "Email Status": lead.email_status or "",
-                "Email Confidence": f"{lead.email_confidence}%" if lead.email_confidence else "",
-                "Title": lead.title or "",
-                "Company": lead.company_name or "",
-                "Domain": lead.company_domain or "",
-                "Website": lead.company_website or "",
-                "Industry": lead.industry or "",
-                "Employees": lead.employee_count or "",
-                "Revenue": lead.revenue_estimate or "",
-                "Phone": lead.phone or "",
-                "LinkedIn": lead.linkedin_url or "",
-                "City": lead.city or "",
-                "State": lead.state or "",
-                "Country": lead.country or "",
-                "Quality Score": f"{lead.data_quality_score}/100",
-                "Data Source": lead.data_source or "",
-                "Enriched": "Yes" if lead.is_enriched else "No",
-                "Export Date": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            })
+        rows = CRMIntegration._field_rows(leads)
+        export_date = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        
+        return pd.DataFrame({
+            "ID": [row["id"] or "" for row in rows],
+            "First Name": [row["first_name"] or "" for row in rows],
+            "Last Name": [row["last_name"] or "" for row in rows],
+            "Full Name": [row["full_name"] or "" for row in rows],
+            "Email": [row["email"] or "" for row in rows],
+            "Email Status": [row["email_status"] or "" for row in rows],
+            "Email Confidence": [f"{row['email_confidence']}%" if row["email_confidence"] else "" for row in rows],
+            "Title": [row["title"] or "" for row in rows],
+            "Company": [row["company_name"] or "" for row in rows],
+            "Domain": [row["company_domain"] or "" for row in rows],
+            "Website": [row["company_website"] or "" for row in rows],
+            "Industry": [row["industry"] or "" for row in rows],
+            "Employees": [row["employee_count"] or "" for row in rows],
+            "Revenue": [row["revenue_estimate"] or "" for row in rows],
+            "Phone": [row["phone"] or "" for row in rows],
+            "LinkedIn": [row["linkedin_url"] or "" for row in rows],
+            "City": [row["city"] or "" for row in rows],
+            "State": [row["state"] or "" for row in rows],
+            "Country": pd.Categorical([row["country"] or "" for row in rows]),
+            "Quality Score": [f"{row['data_quality_score']}/100" for row in rows],
+            "Data Source": [row["data_source"] or "" for row in rows],
+            "Enriched": ["Yes" if row["is_enriched"] else "No" for row in rows],
+            "Export Date": [export_date] * len(rows),
+        }, copy=False)
+    
+    
+    @staticmethod
+    def _iter_chunks(leads: List[Lead], size: int = EXPORT_CHUNK_SIZE) -> Iterator[List[Lead]]:
+        """Yield consecutive slices of at most `size` leads (one empty slice if there are none)"""
+        if not leads:
+            yield leads
+            return
+        for start in range(0, len(leads), size):
+            yield leads[start:start + size]
+    
+    
+    @staticmethod
+    def write_csv(leads: List[Lead], path_or_buf,
+                  exporter: Callable[[List[Lead]], pd.DataFrame] = None,
+                  chunk_size: int = EXPORT_CHUNK_SIZE) -> None:
+        """
+        Stream an export to CSV chunk by chunk
+        Only one chunk's DataFrame is held in memory at a time
+        """
+        exporter = exporter or CRMIntegration.export_generic_crm_format
+        
+        for i, chunk in enumerate(CRMIntegration._iter_chunks(leads, chunk_size)):
+            exporter(chunk).to_csv(path_or_buf, mode='w' if i == 0 else 'a', header=(i == 0), index=False)
+    
+    
+    @staticmethod
+    def write_parquet(leads: List[Lead], path,
+                      exporter: Callable[[List[Lead]], pd.DataFrame] = None,
+                      chunk_size: int = EXPORT_CHUNK_SIZE) -> None:
+        """
+        Stream an export to Parquet, appending one row group per chunk
+        """
+        exporter = exporter or CRMIntegration.export_generic_crm_format
+        writer = None
         
-        return pd.DataFrame(data)
+        try:
+            for chunk in CRMIntegration._iter_chunks(leads, chunk_size):
+                df = exporter(chunk)
+                # Placeholder columns get one nullable numeric type in every chunk,
+                # so a chunk with no missing values can't fix the schema to int64
+                for column, dtype in NULLABLE_NUMERIC_COLUMNS.items():
+                    if column in df:
+                        df[column] = pd.to_numeric(df[column].replace("", None)).astype(dtype)
+                # Text and categorical columns are written as plain strings; a categorical's
+                # dictionary index width depends on how many categories a chunk happens to have
+                text = df.select_dtypes(include=["object", "str", "category"]).columns
+                df[text] = df[text].astype(str)
+                table = pa.Table.from_pandas(df, preserve_index=False)
+                if writer is None:
+                    writer = pq.ParquetWriter(path, table.schema)
+                else:
+                    table = table.cast(writer.schema)
+                writer.write_table(table)
+        finally:
+            if writer is not None:
+                writer.close()
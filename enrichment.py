@@ -1,12 +1,41 @@
 """
 Contact enrichment using Hunter.io API
 """
-import requests
-import time
-from typing import Optional, Dict, List
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from types import MappingProxyType
+from typing import Optional, Dict, List, Tuple
+from urllib.parse import quote
 from config import settings
 from models import EmailVerificationResult, EmailStatus, ConfidenceLevel, Lead
 from validator import EmailValidator
+from cache import BoundedCache
+from http_client import create_session, parse_json, TokenBucket
+
+
+# Maximum number of verification results kept per enricher
+VERIFY_CACHE_MAX_SIZE = 10_000
+
+# Hunter.io status string -> EmailStatus
+_STATUS_MAP = MappingProxyType({
+    'valid': EmailStatus.VALID,
+    'invalid': EmailStatus.INVALID,
+    'accept_all': EmailStatus.ACCEPT_ALL,
+    'webmail': EmailStatus.WEBMAIL,
+    'disposable': EmailStatus.DISPOSABLE,
+    'unknown': EmailStatus.UNKNOWN,
+    'blocked': EmailStatus.BLOCKED
+})
+
+# Lead fields worth 5 quality points each when present
+_QUALITY_FIELDS = (
+    # Contact info
+    'first_name', 'last_name', 'phone', 'linkedin_url',
+    # Company info
+    'company_name', 'company_domain', 'company_website', 'industry',
+    # Additional data (city + state scored together)
+    'title', 'revenue_estimate', 'employee_count',
+)
 
 
 class ContactEnricher:
@@ -16,29 +45,73 @@ class ContactEnricher:
         self.api_key = api_key or settings.hunter_api_key
         self.base_url = settings.hunter_base_url
         self.validator = EmailValidator()
+        self.session = create_session(settings.verify_cache_ttl, self.api_key)
+        self.rate_limiter = TokenBucket(settings.max_requests_per_minute)
+        self._verify_cache = BoundedCache(VERIFY_CACHE_MAX_SIZE)
+        # Verifications in progress, so concurrent duplicates wait instead of calling the API again
+        self._verify_inflight: Dict[str, Future] = {}
+        self._verify_inflight_lock = threading.Lock()
+        
+        # Endpoint URLs with the fixed api_key already encoded
+        key = quote(self.api_key or "", safe="")
+        self._verify_url = f"{self.base_url}/email-verifier?api_key={key}&email="
+        self._finder_url = f"{self.base_url}/email-finder?api_key={key}"
         
         if not self.api_key:
             print(" Warning: No Hunter.io API key found. Get free 50 credits/month at https://hunter.io")
     
     def verify_email(self, email: str) -> Optional[EmailVerificationResult]:
+        """
+        Verify email, reusing earlier results for the same normalized address
+        Repeated emails in a batch cost no extra API credits, including duplicates
+        verified concurrently: later callers wait for the request already in flight
+        Fallbacks built after an API error are not cached, so the next call retries Hunter.io
+        """
+        email_norm = email.strip().lower()
+        cached = self._verify_cache.get(email_norm)
+        if cached is not None:
+            return cached
+        
+        with self._verify_inflight_lock:
+            cached = self._verify_cache.get(email_norm)
+            if cached is not None:
+                return cached
+            pending = self._verify_inflight.get(email_norm)
+            if pending is None:
+                future = self._verify_inflight[email_norm] = Future()
+        if pending is not None:
+            return pending.result()
+        
+        try:
+            result, cacheable = self._verify_email_uncached(email)
+            if result is not None and cacheable:
+                self._verify_cache.put(email_norm, result)
+            future.set_result(result)
+            return result
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._verify_inflight_lock:
+                self._verify_inflight.pop(email_norm, None)
+    
+    def _verify_email_uncached(self, email: str) -> Tuple[Optional[EmailVerificationResult], bool]:
         """
         Verify email using Hunter.io Email Verifier API
         Docs: https://hunter.io/api/email-verifier
+        Returns the result and whether it is safe to cache
         """
         if not self.api_key:
-            return self._fallback_verification(email)
+            return self._fallback_verification(email), True
         
-        endpoint = f"{self.base_url}/email-verifier"
-        params = {
-            'email': email,
-            'api_key': self.api_key
-        }
+        url = self._verify_url + quote(email, safe="")
         
         try:
-            response = requests.get(endpoint, params=params, timeout=10)
+            self.rate_limiter.acquire()
+            response = self.session.get(url, timeout=10)
             
             if response.status_code == 200:
-                data = response.json().get('data', {})
+                data = parse_json(response).get('data', {})
                 
                 return EmailVerificationResult(
                     email=data.get('email', email),
@@ -55,19 +128,20 @@ class ContactEnricher:
                     accept_all=data.get('accept_all', False),
                     block=data.get('block', False),
                     sources=data.get('sources', [])
-                )
+                ), True
             
             elif response.status_code == 429:
+                self.rate_limiter.pause_from_response(response)
                 print(f" Rate limit exceeded. Falling back to local validation.")
-                return self._fallback_verification(email)
+                return self._fallback_verification(email), False
             
             else:
                 print(f"❌ API Error {response.status_code}: {response.text}")
-                return self._fallback_verification(email)
+                return self._fallback_verification(email), False
                 
         except Exception as e:
             print(f" Error verifying {email}: {str(e)}")
-            return self._fallback_verification(email)
+            return self._fallback_verification(email), False
     
     def _fallback_verification(self, email: str) -> EmailVerificationResult:
         """
@@ -120,25 +194,26 @@ class ContactEnricher:
         if not self.api_key:
             return self._guess_email(first_name, last_name, domain)
         
-        endpoint = f"{self.base_url}/email-finder"
-        params = {
-            'domain': domain,
-            'first_name': first_name,
-            'last_name': last_name,
-            'api_key': self.api_key
-        }
+        url = (
+            f"{self._finder_url}&domain={quote(domain, safe='')}"
+            f"&first_name={quote(first_name, safe='')}&last_name={quote(last_name, safe='')}"
+        )
         
         try:
-            response = requests.get(endpoint, params=params, timeout=10)
+            self.rate_limiter.acquire()
+            response = self.session.get(url, timeout=10)
             
             if response.status_code == 200:
-                data = response.json().get('data', {})
+                data = parse_json(response).get('data', {})
                 email = data.get('email')
                 score = data.get('score', 0)
                 
                 if email and score > 50:
                     return email
             
+            elif response.status_code == 429:
+                self.rate_limiter.pause_from_response(response)
+            
             return self._guess_email(first_name, last_name, domain)
             
         except Exception as e:
@@ -159,7 +234,7 @@ class ContactEnricher:
         """
         Enrich a lead with verified contact information
         """
-        enriched_lead = lead.copy()
+        enriched_lead = lead.model_copy()
         enrichment_sources = []
         
         # Verify email if exists
@@ -196,34 +271,29 @@ class ContactEnricher:
     
     def bulk_enrich(self, leads: List[Lead], max_requests: int = 50) -> List[Lead]:
         """
-        Enrich multiple leads with rate limiting
+        Enrich multiple leads concurrently with rate limiting
+        Results are returned in the same order as the input leads
+        Run LeadScraper.deduplicate_leads first so duplicates don't use up max_requests
         """
+        batch = leads[:max_requests]
         enriched_leads = []
         
-        for i, lead in enumerate(leads[:max_requests]):
-            if i > 0 and i % 10 == 0:
-                time.sleep(1)  # Rate limiting
+        with ThreadPoolExecutor(max_workers=settings.max_concurrent_requests) as pool:
+            # Requests are paced by self.rate_limiter
+            futures = [pool.submit(self.enrich_lead, lead) for lead in batch]
             
-            enriched = self.enrich_lead(lead)
-            enriched_leads.append(enriched)
-            
-            print(f"✅ Enriched {i+1}/{min(len(leads), max_requests)}: {lead.company_name or 'Unknown'}")
+            for i, (lead, future) in enumerate(zip(batch, futures)):
+                enriched_leads.append(future.result())
+                print(f"✅ Enriched {i+1}/{len(batch)}: {lead.company_name or 'Unknown'}")
         
         return enriched_leads
     
     @staticmethod
-    def _map_status(status_str: str) -> EmailStatus:
+    def _map_status(status_str: Optional[str]) -> EmailStatus:
         """Map Hunter.io status to EmailStatus enum"""
-        status_map = {
-            'valid': EmailStatus.VALID,
-            'invalid': EmailStatus.INVALID,
-            'accept_all': EmailStatus.ACCEPT_ALL,
-            'webmail': EmailStatus.WEBMAIL,
-            'disposable': EmailStatus.DISPOSABLE,
-            'unknown': EmailStatus.UNKNOWN,
-            'blocked': EmailStatus.BLOCKED
-        }
-        return status_map.get(status_str.lower(), EmailStatus.UNKNOWN)
+        if not status_str:
+            return EmailStatus.UNKNOWN
+        return _STATUS_MAP.get(status_str.lower(), EmailStatus.UNKNOWN)
     
     @staticmethod
     def _calculate_quality_score(lead: Lead) -> int:
@@ -238,33 +308,9 @@ class ContactEnricher:
             if lead.email_confidence:
                 score += min(30, int(lead.email_confidence * 0.3))
         
-        # Contact info completeness (20 points)
-        if lead.first_name:
-            score += 5
-        if lead.last_name:
-            score += 5
-        if lead.phone:
-            score += 5
-        if lead.linkedin_url:
-            score += 5
-        
-        # Company info completeness (20 points)
-        if lead.company_name:
-            score += 5
-        if lead.company_domain:
-            score += 5
-        if lead.company_website:
-            score += 5
-        if lead.industry:
-            score += 5
-        
-        # Additional data (20 points)
-        if lead.title:
-            score += 5
-        if lead.revenue_estimate:
-            score += 5
-        if lead.employee_count:
-            score += 5
+        # Contact, company and additional data completeness (5 points per field)
+        fields = lead.__dict__
+        score += 5 * sum(1 for name in _QUALITY_FIELDS if fields.get(name))
         if lead.city and lead.state:
             score += 5
         
@@ -0,0 +1,116 @@
+"""
+Shared HTTP session and rate limiting for Hunter.io API calls
+"""
+import hashlib
+import os
+import threading
+import time
+from typing import Optional
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from config import settings
+
+try:
+    import orjson
+except ImportError:  # optional faster JSON decoder
+    orjson = None
+
+try:
+    import requests_cache
+except ImportError:  # optional on-disk response cache
+    requests_cache = None
+
+
+def _cache_path_for_key(api_key: str) -> str:
+    """Per-key variant of settings.hunter_cache_path, named after a hash of the key"""
+    root, ext = os.path.splitext(settings.hunter_cache_path)
+    return f"{root}-{hashlib.sha256(api_key.encode()).hexdigest()[:16]}{ext}"
+
+
+def create_session(expire_after: Optional[int] = None, api_key: Optional[str] = None) -> requests.Session:
+    """
+    Create a requests session with keep-alive connection pooling and retries
+    With expire_after (seconds) and an api_key, successful responses are cached on disk when
+    requests-cache is installed, in a cache file of that key's own
+    """
+    retry = Retry(
+        total=5,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+        raise_on_status=False  # Return the last response so callers can handle it
+    )
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=retry)
+    
+    if expire_after and api_key and requests_cache is not None:
+        # api_key is in requests-cache's default ignored_parameters, so it is neither part of the
+        # cache key nor stored; one file per key keeps other keys from reading these responses
+        session = requests_cache.CachedSession(
+            _cache_path_for_key(api_key),
+            backend="sqlite",
+            expire_after=expire_after,
+            allowable_codes=[200]
+        )
+    else:
+        session = requests.Session()
+    session.mount("https://", adapter)
+    session.headers.update({
+        "User-Agent": f"{settings.app_name}/{settings.app_version}",
+        "Accept": "application/json"
+    })
+    return session
+
+
+def parse_json(response: requests.Response):
+    """
+    Decode a JSON response body, using orjson when it is installed
+    """
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+class TokenBucket:
+    """
+    Thread-safe token-bucket rate limiter
+    Allows bursts up to rate_per_minute, refilling continuously
+    """
+    
+    def __init__(self, rate_per_minute: int):
+        self.capacity = float(rate_per_minute)
+        self.rate = rate_per_minute / 60.0  # tokens per second
+        self.tokens = self.capacity
+        self.last = time.monotonic()
+        self.paused_until = 0.0
+        self._lock = threading.Lock()
+    
+    def acquire(self):
+        """Block until a request may be sent"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.last) * self.rate)
+                self.last = now
+                
+                if now < self.paused_until:
+                    wait = self.paused_until - now
+                elif self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                else:
+                    wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+    
+    def pause(self, seconds: float):
+        """Hold all requests for the given number of seconds (e.g. from Retry-After)"""
+        with self._lock:
+            self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+            self.tokens = 0.0
+    
+    def pause_from_response(self, response: requests.Response):
+        """Honor the Retry-After header of a throttled response"""
+        retry_after = response.headers.get("Retry-After")
+        try:
+            self.pause(float(retry_after) if retry_after else 60.0 / self.capacity)
+        except ValueError:
+            self.pause(60.0 / self.capacity)
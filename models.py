@@ -1,7 +1,8 @@
 """
 Data models for AcquireIQ
 """
-from pydantic import BaseModel, EmailStr, Field, validator
+from pydantic import BaseModel, ConfigDict, Field
+from dataclasses import dataclass, field, asdict
 from typing import Optional, List, Dict
 from datetime import datetime
 from enum import Enum
@@ -26,37 +27,42 @@ class ConfidenceLevel(str, Enum):
     VERY_LOW = "very_low"  # <50%
 
 
-class EmailVerificationResult(BaseModel):
-    """Email verification result from Hunter.io"""
+@dataclass(slots=True)
+class EmailVerificationResult:
+    """
+    Email verification result from Hunter.io
+    Plain dataclass: built internally on the verification hot path, so it skips pydantic validation
+    """
     email: str
     status: EmailStatus
-    score: int = Field(ge=0, le=100, description="Confidence score 0-100")
-    confidence_level: ConfidenceLevel
-    regexp: bool = Field(description="Email format is valid")
-    gibberish: bool = Field(description="Email looks fake")
-    disposable: bool = Field(description="Disposable email service")
-    webmail: bool = Field(description="Webmail provider like Gmail")
-    mx_records: bool = Field(description="Domain has MX records")
-    smtp_server: bool = Field(description="SMTP server exists")
-    smtp_check: bool = Field(description="Mailbox exists")
-    accept_all: bool = Field(description="Server accepts all emails")
-    block: bool = Field(description="Email is blocked")
-    sources: List[Dict] = Field(default_factory=list, description="Where email was found")
+    score: int  # Confidence score 0-100
+    confidence_level: ConfidenceLevel  # Derived from score in __post_init__
+    regexp: bool  # Email format is valid
+    gibberish: bool  # Email looks fake
+    disposable: bool  # Disposable email service
+    webmail: bool  # Webmail provider like Gmail
+    mx_records: bool  # Domain has MX records
+    smtp_server: bool  # SMTP server exists
+    smtp_check: bool  # Mailbox exists
+    accept_all: bool  # Server accepts all emails
+    block: bool  # Email is blocked
+    sources: List[Dict] = field(default_factory=list)  # Where email was found
     
-    @validator('confidence_level', pre=True, always=True)
-    def determine_confidence(cls, v, values):
+    def __post_init__(self):
         """Determine confidence level from score"""
-        if 'score' in values:
-            score = values['score']
-            if score >= 90:
-                return ConfidenceLevel.HIGH
-            elif score >= 70:
-                return ConfidenceLevel.MEDIUM
-            elif score >= 50:
-                return ConfidenceLevel.LOW
-            else:
-                return ConfidenceLevel.VERY_LOW
-        return v
+        score = self.score
+        if score >= 90:
+            self.confidence_level = ConfidenceLevel.HIGH
+        elif score >= 70:
+            self.confidence_level = ConfidenceLevel.MEDIUM
+        elif score >= 50:
+            self.confidence_level = ConfidenceLevel.LOW
+        else:
+            self.confidence_level = ConfidenceLevel.VERY_LOW
+    
+    def to_dict(self) -> Dict:
+        """Convert to a plain dict"""
+        return asdict(self)
 
 
 class PhoneNumber(BaseModel):
@@ -114,8 +120,23 @@ class Lead(BaseModel):
     data_source: Optional[str] = None
     verification_sources: List[str] = Field(default_factory=list)
     
-    class Config:
-        use_enum_values = True
+    model_config = ConfigDict(use_enum_values=True, extra="ignore")
+    
+    def to_row(self) -> Dict:
+        """
+        Flat dict of the fields the dashboard charts use
+        Reads attributes directly instead of a full model_dump()
+        """
+        status = self.email_status
+        return {
+            "full_name": self.full_name,
+            "email": self.email,
+            "email_status": status.value if hasattr(status, "value") else status,
+            "email_confidence": self.email_confidence,
+            "data_quality_score": self.data_quality_score,
+            "city": self.city,
+            "state": self.state,
+        }
 
 
 class EnrichmentReport(BaseModel):
@@ -2,11 +2,39 @@
 Lead scraping functionality with advanced features
 """
 import requests
-from typing import List, Dict
+from typing import List, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import quote
+from config import settings
 from models import Lead
-import random
-import pandas as pd
+from http_client import TokenBucket, create_session, parse_json
+import csv
 import io
+import random
+
+
+# Sample data used by LeadScraper.generate_sample_leads
+_SAMPLE_COMPANIES = (
+    {"name": "TechFlow Solutions", "domain": "techflow.com", "industry": "SaaS", "employees": 45, "revenue": 5000000},
+    {"name": "DataSync Inc", "domain": "datasync.io", "industry": "Data Analytics", "employees": 32, "revenue": 3500000},
+    {"name": "CloudBridge Systems", "domain": "cloudbridge.com", "industry": "Cloud Services", "employees": 78, "revenue": 12000000},
+    {"name": "SecureNet Corp", "domain": "securenet.com", "industry": "Cybersecurity", "employees": 55, "revenue": 8000000},
+    {"name": "FinTrack Software", "domain": "fintrack.io", "industry": "FinTech", "employees": 28, "revenue": 2800000},
+    {"name": "HealthHub Technologies", "domain": "healthhub.com", "industry": "HealthTech", "employees": 41, "revenue": 4500000},
+    {"name": "EduLearn Platform", "domain": "edulearn.com", "industry": "EdTech", "employees": 35, "revenue": 3200000},
+    {"name": "LogiChain Solutions", "domain": "logichain.com", "industry": "Logistics", "employees": 62, "revenue": 9000000},
+    {"name": "MarketPulse Analytics", "domain": "marketpulse.io", "industry": "Marketing", "employees": 38, "revenue": 4000000},
+    {"name": "GreenEnergy Systems", "domain": "greenenergy.com", "industry": "CleanTech", "employees": 52, "revenue": 7500000},
+)
+
+_FIRST_NAMES = ("John", "Sarah", "Michael", "Emily", "David", "Jennifer", "Robert", "Lisa", "James", "Mary")
+_LAST_NAMES = ("Smith", "Johnson", "Williams", "Brown", "Jones", "Garcia", "Miller", "Davis", "Rodriguez", "Martinez")
+_TITLES = ("CEO", "Founder", "President", "Managing Director", "VP Operations", "Chief Executive")
+# (city, state) pairs so locations stay consistent
+_LOCATIONS = (
+    ("Austin", "TX"), ("Denver", "CO"), ("Seattle", "WA"), ("Portland", "OR"),
+    ("Nashville", "TN"), ("Charlotte", "NC"), ("San Diego", "CA"), ("Boston", "MA"),
+)
 
 
 class LeadScraper:
@@ -17,38 +45,23 @@ class LeadScraper:
     @staticmethod
     def generate_sample_leads(count: int = 20) -> List[Lead]:
         """Generate sample leads for testing"""
-        sample_companies = [
-            {"name": "TechFlow Solutions", "domain": "techflow.com", "industry": "SaaS", "employees": 45, "revenue": 5000000},
-            {"name": "DataSync Inc", "domain": "datasync.io", "industry": "Data Analytics", "employees": 32, "revenue": 3500000},
-            {"name": "CloudBridge Systems", "domain": "cloudbridge.com", "industry": "Cloud Services", "employees": 78, "revenue": 12000000},
-            {"name": "SecureNet Corp", "domain": "securenet.com", "industry": "Cybersecurity", "employees": 55, "revenue": 8000000},
-            {"name": "FinTrack Software", "domain": "fintrack.io", "industry": "FinTech", "employees": 28, "revenue": 2800000},
-            {"name": "HealthHub Technologies", "domain": "healthhub.com", "industry": "HealthTech", "employees": 41, "revenue": 4500000},
-            {"name": "EduLearn Platform", "domain": "edulearn.com", "industry": "EdTech", "employees": 35, "revenue": 3200000},
-            {"name": "LogiChain Solutions", "domain": "logichain.com", "industry": "Logistics", "employees": 62, "revenue": 9000000},
-            {"name": "MarketPulse Analytics", "domain": "marketpulse.io", "industry": "Marketing", "employees": 38, "revenue": 4000000},
-            {"name": "GreenEnergy Systems", "domain": "greenenergy.com", "industry": "CleanTech", "employees": 52, "revenue": 7500000},
-        ]
-        
-        first_names = ["John", "Sarah", "Michael", "Emily", "David", "Jennifer", "Robert", "Lisa", "James", "Mary"]
-        last_names = ["Smith", "Johnson", "Williams", "Brown", "Jones", "Garcia", "Miller", "Davis", "Rodriguez", "Martinez"]
-        titles = ["CEO", "Founder", "President", "Managing Director", "VP Operations", "Chief Executive"]
-        cities = ["Austin", "Denver", "Seattle", "Portland", "Nashville", "Charlotte", "San Diego", "Boston"]
-        states = ["TX", "CO", "WA", "OR", "TN", "NC", "CA", "MA"]
+        companies = _SAMPLE_COMPANIES[:max(count, 0)]
+        n = len(companies)
         
-        leads = []
+        # Draw all random fields in one batch per column
+        first_names = random.choices(_FIRST_NAMES, k=n)
+        last_names = random.choices(_LAST_NAMES, k=n)
+        titles = random.choices(_TITLES, k=n)
+        locations = random.choices(_LOCATIONS, k=n)
         
-        for i in range(min(count, len(sample_companies))):
-            company = sample_companies[i]
-            first_name = random.choice(first_names)
-            last_name = random.choice(last_names)
-            
-            lead = Lead(
+        # Sample fields are well-typed; skip validation
+        return [
+            Lead.model_construct(
                 id=f"lead_{i+1}",
                 first_name=first_name,
                 last_name=last_name,
                 full_name=f"{first_name} {last_name}",
-                title=random.choice(titles),
+                title=title,
                 company_name=company["name"],
                 company_domain=company["domain"],
                 company_website=f"https://{company['domain']}",
@@ -56,35 +69,35 @@ class LeadScraper:
                 employee_count=company["employees"],
                 revenue_estimate=company["revenue"],
                 email=f"{first_name.lower()}.{last_name.lower()}@{company['domain']}",
-                city=random.choice(cities),
-                state=random.choice(states),
+                city=city,
+                state=state,
                 country="USA",
                 data_source="Sample Data"
             )
-            leads.append(lead)
-        
-        return leads
+            for i, (company, first_name, last_name, title, (city, state))
+            in enumerate(zip(companies, first_names, last_names, titles, locations))
+        ]
 
 
     @staticmethod
-    def scrape_hunter_domain(domain: str, api_key: str, max_results: int = 20) -> List[Lead]:
+    def scrape_hunter_domain(domain: str, api_key: str, max_results: int = 20,
+                             session: Optional[requests.Session] = None) -> List[Lead]:
         """
         Scrape leads from a company domain using Hunter.io Domain Search API
+        Pass a shared session to reuse pooled connections across calls
         """
         if not api_key:
             raise ValueError("Hunter.io API key is required for domain search.")
         
-        url = "https://api.hunter.io/v2/domain-search"
-        params = {
-            "domain": domain,
-            "limit": max_results,
-            "api_key": api_key
-        }
+        url = (
+            f"{settings.hunter_base_url}/domain-search"
+            f"?api_key={quote(api_key, safe='')}&domain={quote(domain, safe='')}&limit={int(max_results)}"
+        )
         
         try:
-            response = requests.get(url, params=params, timeout=10)
+            response = (session or create_session(settings.domain_search_cache_ttl, api_key)).get(url, timeout=10)
             response.raise_for_status()
-            data = response.json()
+            data = parse_json(response)
             
             leads = []
             company_data = data.get("data", {})
@@ -111,24 +124,136 @@ class LeadScraper:
 
 
     @staticmethod
-    def bulk_domain_search(domains: List[str], api_key: str, max_results_per_domain: int = 20) -> List[Lead]:
+    def bulk_domain_search(domains: List[str], api_key: str, max_results_per_domain: int = 20,
+                           rate_limiter: Optional[TokenBucket] = None) -> List[Lead]:
         """
-        Search multiple domains in bulk
+        Search multiple domains in bulk, running domain searches concurrently
+        Repeated domains are searched once
+        Pass the enricher's rate limiter so both share one Hunter.io request budget
         """
         all_leads = []
+        # Normalize and drop repeats, keeping input order, so no credits are spent twice
+        domains = list(dict.fromkeys(d.strip().lower() for d in domains if d and d.strip()))
+        if not domains:
+            return all_leads
         
-        for domain in domains:
-            try:
-                leads = LeadScraper.scrape_hunter_domain(domain.strip(), api_key, max_results_per_domain)
-                all_leads.extend(leads)
-                print(f"✅ Retrieved {len(leads)} leads from {domain}")
-            except Exception as e:
-                print(f"❌ Error with domain {domain}: {e}")
-                continue
+        session = create_session(settings.domain_search_cache_ttl, api_key)
+        rate_limiter = rate_limiter or TokenBucket(settings.max_requests_per_minute)
+        
+        def search(domain: str) -> List[Lead]:
+            rate_limiter.acquire()
+            return LeadScraper.scrape_hunter_domain(domain, api_key, max_results_per_domain, session)
+        
+        with ThreadPoolExecutor(max_workers=min(settings.max_concurrent_requests, len(domains))) as pool:
+            futures = [pool.submit(search, domain) for domain in domains]
+            failed = []
+            
+            for domain, future in zip(domains, futures):
+                try:
+                    all_leads.extend(future.result())
+                except Exception:
+                    failed.append(domain)
+        
+        if failed:
+            print(f"❌ Domain search failed for {len(failed)} of {len(domains)} domains: {', '.join(failed)}")
         
         return all_leads
 
 
+    # Accepted alternative CSV headers for Lead fields
+    CSV_COLUMN_ALIASES = {
+        'firstname': 'first_name',
+        'lastname': 'last_name',
+        'position': 'title',
+        'company': 'company_name',
+        'domain': 'company_domain',
+        'website': 'company_website',
+    }
+    
+    # Lead fields read from an uploaded CSV
+    CSV_COLUMNS = [
+        'first_name', 'last_name', 'full_name', 'email', 'title',
+        'company_name', 'company_domain', 'company_website', 'industry',
+        'phone', 'city', 'state', 'country',
+    ]
+    
+    # Uploads smaller than this are parsed with the stdlib csv module instead of pandas
+    CSV_FAST_PATH_MAX_BYTES = 1_000_000
+    
+    @staticmethod
+    def _csv_header_map(headers: List[str]) -> Dict[str, str]:
+        """
+        Map normalized CSV headers to Lead fields
+        Alternative headers are used only when the canonical column is absent
+        """
+        normalized = {h: h.lower().strip() for h in headers if h is not None}
+        present = set(normalized.values())
+        return {
+            header: (
+                LeadScraper.CSV_COLUMN_ALIASES[name]
+                if name in LeadScraper.CSV_COLUMN_ALIASES and LeadScraper.CSV_COLUMN_ALIASES[name] not in present
+                else name
+            )
+            for header, name in normalized.items()
+        }
+    
+    @staticmethod
+    def _csv_lead(i: int, row: Dict[str, str]) -> Lead:
+        """Build a lead from one row of Lead-field strings"""
+        # Every cell is already a str, so build leads without re-validating
+        return Lead.model_construct(id=f"csv_lead_{i+1}", data_source="CSV Upload", **row)
+    
+    @staticmethod
+    def _parse_csv_small(data: bytes) -> List[Lead]:
+        """Parse a small CSV with csv.DictReader, bypassing pandas"""
+        reader = csv.DictReader(io.StringIO(data.decode('utf-8-sig')))
+        header_map = LeadScraper._csv_header_map(reader.fieldnames or [])
+        has_full_name = 'full_name' in header_map.values()
+        
+        leads = []
+        for i, raw in enumerate(reader):
+            row = dict.fromkeys(LeadScraper.CSV_COLUMNS, '')
+            for header, field_name in header_map.items():
+                if field_name in row:
+                    row[field_name] = raw.get(header) or ''
+            if not has_full_name:
+                row['full_name'] = f"{row['first_name']} {row['last_name']}".strip()
+            leads.append(LeadScraper._csv_lead(i, row))
+        return leads
+    
+    @staticmethod
+    def _parse_csv_large(source) -> List[Lead]:
+        """
+        Parse a large CSV with pandas' pyarrow engine and column-wise extraction
+        Files pyarrow rejects (empty, ragged rows) go through the csv.DictReader path instead
+        """
+        import pandas as pd
+        
+        # Read CSV as text so cells are passed through unchanged
+        # The multithreaded pyarrow parser is much faster than the C engine on large uploads
+        try:
+            df = pd.read_csv(source, engine='pyarrow', dtype=str, keep_default_na=False).fillna('')
+        except ValueError:
+            if hasattr(source, 'seek'):
+                source.seek(0)
+                data = source.read()
+            else:
+                with open(source, 'rb') as f:
+                    data = f.read()
+            return LeadScraper._parse_csv_small(data)
+        df = df.rename(columns=LeadScraper._csv_header_map(list(df.columns)))
+        
+        has_full_name = 'full_name' in df.columns
+        df = df.reindex(columns=LeadScraper.CSV_COLUMNS, fill_value='')
+        if not has_full_name:
+            df['full_name'] = (df['first_name'] + ' ' + df['last_name']).str.strip()
+        
+        columns = [df[column].tolist() for column in LeadScraper.CSV_COLUMNS]
+        return [
+            LeadScraper._csv_lead(i, dict(zip(LeadScraper.CSV_COLUMNS, values)))
+            for i, values in enumerate(zip(*columns))
+        ]
+    
     @staticmethod
     def parse_csv_upload(uploaded_file) -> List[Lead]:
         """
@@ -136,32 +261,18 @@ class LeadScraper:
         Expected columns: first_name, last_name, email, company_name, company_domain, title
         """
         try:
-            # Read CSV
-            df = pd.read_csv(uploaded_file)
-            
-            # Normalize column names (lowercase, strip spaces)
-            df.columns = df.columns.str.lower().str.strip()
-            
-            leads = []
-            for idx, row in df.iterrows():
-                lead = Lead(
-                    id=f"csv_lead_{idx+1}",
-                    first_name=row.get('first_name', row.get('firstname', '')),
-                    last_name=row.get('last_name', row.get('lastname', '')),
-                    full_name=row.get('full_name', f"{row.get('first_name', '')} {row.get('last_name', '')}".strip()),
-                    email=row.get('email', ''),
-                    title=row.get('title', row.get('position', '')),
-                    company_name=row.get('company_name', row.get('company', '')),
-                    company_domain=row.get('company_domain', row.get('domain', '')),
-                    company_website=row.get('company_website', row.get('website', '')),
-                    industry=row.get('industry', ''),
-                    phone=row.get('phone', ''),
-                    city=row.get('city', ''),
-                    state=row.get('state', ''),
-                    country=row.get('country', ''),
-                    data_source="CSV Upload"
-                )
-                leads.append(lead)
+            if hasattr(uploaded_file, 'read'):
+                data = uploaded_file.read()
+                if isinstance(data, str):
+                    data = data.encode('utf-8')
+                
+                if len(data) < LeadScraper.CSV_FAST_PATH_MAX_BYTES:
+                    leads = LeadScraper._parse_csv_small(data)
+                else:
+                    leads = LeadScraper._parse_csv_large(io.BytesIO(data))
+            else:
+                # File path
+                leads = LeadScraper._parse_csv_large(uploaded_file)
             
             print(f"✅ Parsed {len(leads)} leads from CSV")
             return leads
@@ -180,18 +291,16 @@ class LeadScraper:
         seen_emails = {}
         
         for lead in leads:
-            if not lead.email:
+            email = lead.email
+            if not email:
                 continue
-                
-            email_lower = lead.email.lower()
             
-            if email_lower not in seen_emails:
+            email_lower = email.lower()
+            existing_lead = seen_emails.get(email_lower)
+            
+            # Keep lead with higher quality score
+            if existing_lead is None or lead.data_quality_score > existing_lead.data_quality_score:
                 seen_emails[email_lower] = lead
-            else:
-                # Keep lead with higher quality score
-                existing_lead = seen_emails[email_lower]
-                if lead.data_quality_score > existing_lead.data_quality_score:
-                    seen_emails[email_lower] = lead
         
         deduplicated = list(seen_emails.values())
         duplicates_removed = len(leads) - len(deduplicated)
@@ -0,0 +1,67 @@
+"""
+Tests for chunked CRM exports
+"""
+import os
+import tempfile
+import unittest
+
+import pyarrow.parquet as pq
+
+from crm_integration import CRMIntegration
+from models import Lead
+
+
+def make_lead(i, employee_count=250, revenue_estimate=1_000_000.0, country="US"):
+    return Lead(
+        first_name=f"First{i}",
+        last_name=f"Last{i}",
+        email=f"user{i}@example.com",
+        company_name="Example",
+        employee_count=employee_count,
+        revenue_estimate=revenue_estimate,
+        country=country,
+    )
+
+
+class WriteParquetTest(unittest.TestCase):
+
+    def setUp(self):
+        handle, self.path = tempfile.mkstemp(suffix=".parquet")
+        os.close(handle)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_missing_numbers_after_first_chunk(self):
+        # First chunk is all numeric; a later chunk has "" placeholders for None
+        leads = [make_lead(i) for i in range(3)]
+        leads += [make_lead(3, employee_count=None, revenue_estimate=None), make_lead(4)]
+
+        CRMIntegration.write_parquet(leads, self.path, chunk_size=3)
+
+        table = pq.read_table(self.path)
+        self.assertEqual(table.num_rows, len(leads))
+        self.assertEqual(pq.ParquetFile(self.path).num_row_groups, 2)
+        self.assertEqual(table.column("Employees").to_pylist(), [250, 250, 250, None, 250])
+        self.assertEqual(table.column("Revenue").to_pylist()[3], None)
+
+    def test_missing_numbers_in_first_chunk(self):
+        leads = [make_lead(0, employee_count=None), make_lead(1), make_lead(2)]
+
+        CRMIntegration.write_parquet(leads, self.path, chunk_size=2)
+
+        self.assertEqual(pq.read_table(self.path).column("Employees").to_pylist(), [None, 250, 250])
+
+    def test_categories_growing_across_chunks(self):
+        # 1 country in the first chunk, 150 in the second: past int8 dictionary indices
+        leads = [make_lead(i) for i in range(150)]
+        leads += [make_lead(150 + i, country=f"Country {i}") for i in range(150)]
+
+        CRMIntegration.write_parquet(leads, self.path, chunk_size=150)
+
+        countries = pq.read_table(self.path).column("Country").to_pylist()
+        self.assertEqual(countries, [lead.country for lead in leads])
+
+
+if __name__ == "__main__":
+    unittest.main()
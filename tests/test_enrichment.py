@@ -0,0 +1,63 @@
+"""
+Tests for ContactEnricher verification caching
+"""
+import json
+import threading
+import time
+import unittest
+
+from enrichment import ContactEnricher
+from models import Lead
+
+
+class FakeResponse:
+    status_code = 200
+    headers = {}
+    text = ""
+
+    def __init__(self, email):
+        self._email = email
+
+    def json(self):
+        return {"data": {"email": self._email, "status": "valid", "score": 90}}
+
+    @property
+    def content(self):
+        return json.dumps(self.json()).encode()
+
+
+class FakeSession:
+    """Counts verifier calls; the delay keeps duplicate requests in flight together"""
+
+    def __init__(self):
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def get(self, url, timeout=None):
+        with self._lock:
+            self.calls += 1
+        time.sleep(0.05)
+        return FakeResponse(url.rsplit("=", 1)[1].replace("%40", "@"))
+
+
+class VerifyEmailTest(unittest.TestCase):
+
+    def setUp(self):
+        self.enricher = ContactEnricher(api_key="test-key")
+        self.enricher.session = FakeSession()
+        self.enricher.rate_limiter.acquire = lambda: None
+
+    def test_concurrent_duplicates_verify_once(self):
+        leads = [
+            Lead(first_name="A", last_name="B", email=f"User{i % 5}@example.com ", company_name="X")
+            for i in range(20)
+        ]
+
+        enriched = self.enricher.bulk_enrich(leads, max_requests=20)
+
+        self.assertEqual(len(enriched), 20)
+        self.assertEqual(self.enricher.session.calls, 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,122 @@
+"""
+Tests for pipelined bulk MX lookups
+"""
+import socket
+import threading
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+import dns.message
+import dns.rdata
+import dns.rdataclass
+import dns.rdatatype
+import dns.rcode
+import dns.resolver
+
+import validator
+from validator import EmailValidator
+
+
+class StubNameserver:
+    """
+    Loopback UDP nameserver that collects an expected number of MX queries,
+    then answers them in reverse order, after one reply with an unknown id
+    Domains in `dropped` get no reply
+    """
+
+    def __init__(self, expected: int, mx: dict, nxdomain=(), dropped=()):
+        self.expected = expected
+        self.mx = mx
+        self.nxdomain = set(nxdomain)
+        self.dropped = set(dropped)
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.sock.bind(("127.0.0.1", 0))
+        self.sock.settimeout(2)
+        self.port = self.sock.getsockname()[1]
+        self.thread = threading.Thread(target=self._serve, daemon=True)
+
+    def _serve(self):
+        queries = []
+        while len(queries) < self.expected:
+            data, addr = self.sock.recvfrom(65535)
+            queries.append((dns.message.from_wire(data), addr))
+
+        stray = dns.message.make_response(queries[0][0])
+        stray.id = (queries[0][0].id + 1) % 65536
+        self.sock.sendto(stray.to_wire(), queries[0][1])
+
+        for query, addr in reversed(queries):
+            domain = query.question[0].name.to_text(omit_final_dot=True)
+            if domain in self.dropped:
+                continue
+            response = dns.message.make_response(query)
+            if domain in self.nxdomain:
+                response.set_rcode(dns.rcode.NXDOMAIN)
+            else:
+                for exchange in self.mx.get(domain, []):
+                    rrset = response.find_rrset(
+                        response.answer, query.question[0].name, dns.rdataclass.IN,
+                        dns.rdatatype.MX, create=True,
+                    )
+                    rrset.add(dns.rdata.from_text(dns.rdataclass.IN, dns.rdatatype.MX, f"10 {exchange}"), 300)
+            self.sock.sendto(response.to_wire(), addr)
+
+    def resolver(self, lifetime=0.5):
+        return SimpleNamespace(nameservers=["127.0.0.1"], port=self.port, lifetime=lifetime)
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.thread.join(timeout=2)
+        self.sock.close()
+
+
+class CheckMxRecordsBulkTest(unittest.TestCase):
+
+    def setUp(self):
+        validator._mx_cache.clear()
+        self.fallback = mock.patch.object(
+            EmailValidator, "check_mx_records", side_effect=lambda domain: (False, [])
+        ).start()
+        self.addCleanup(mock.patch.stopall)
+        self.addCleanup(validator._mx_cache.clear)
+
+    def test_replies_matched_by_query_id(self):
+        with StubNameserver(3, mx={"a.test": ["mx.a.test."], "b.test": ["mx1.b.test.", "mx2.b.test."]},
+                            nxdomain=["missing.test"]) as stub:
+            with mock.patch("dns.resolver.get_default_resolver", return_value=stub.resolver()):
+                results = EmailValidator.check_mx_records_bulk(["a.test", "b.test", "missing.test"])
+
+        self.assertEqual(results["a.test"], (True, ["mx.a.test."]))
+        self.assertEqual(results["b.test"][0], True)
+        self.assertEqual(sorted(results["b.test"][1]), ["mx1.b.test.", "mx2.b.test."])
+        self.assertEqual(results["missing.test"], (False, []))
+        self.fallback.assert_not_called()
+        # Definitive answers are cached
+        self.assertIn("a.test", validator._mx_cache)
+        self.assertIn("missing.test", validator._mx_cache)
+
+    def test_dropped_reply_falls_back(self):
+        with StubNameserver(2, mx={"a.test": ["mx.a.test."]}, dropped=["slow.test"]) as stub:
+            with mock.patch("dns.resolver.get_default_resolver", return_value=stub.resolver(lifetime=0.3)):
+                results = EmailValidator.check_mx_records_bulk(["a.test", "slow.test"])
+
+        self.assertEqual(results["a.test"], (True, ["mx.a.test."]))
+        self.assertEqual(results["slow.test"], (False, []))
+        self.fallback.assert_called_once_with("slow.test")
+        self.assertNotIn("slow.test", validator._mx_cache)
+
+    def test_missing_resolver_configuration_falls_back(self):
+        with mock.patch("dns.resolver.get_default_resolver",
+                        side_effect=dns.resolver.NoResolverConfiguration):
+            results = EmailValidator.check_mx_records_bulk(["a.test", "b.test"])
+
+        self.assertEqual(results, {"a.test": (False, []), "b.test": (False, [])})
+        self.assertEqual(self.fallback.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
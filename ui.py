@@ -6,8 +6,9 @@ import streamlit as st
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-import time
+import uuid
 
 from config import settings
 from models import Lead, EmailStatus, ConfidenceLevel, EnrichmentReport
@@ -26,8 +27,8 @@ st.set_page_config(
 )
 
 
-# Custom CSS
-st.markdown("""
+# Custom CSS, built once at import and injected by render_header
+CUSTOM_CSS = """
 <style>
     .main-header {
         font-size: 3rem;
@@ -56,7 +57,25 @@ st.markdown("""
         font-weight: bold;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+
+@st.cache_resource
+def get_enricher(api_key: str) -> ContactEnricher:
+    """Long-lived enricher per API key, reusing its HTTP session, rate limiter and verification cache"""
+    return ContactEnricher(api_key=api_key)
+
+
+@st.cache_resource
+def get_scraper() -> LeadScraper:
+    """Shared lead scraper"""
+    return LeadScraper()
+
+
+@st.cache_resource
+def get_crm() -> CRMIntegration:
+    """Shared CRM exporter"""
+    return CRMIntegration()
 
 
 def init_session_state():
@@ -65,6 +84,8 @@ def init_session_state():
         st.session_state.leads = []
     if 'enriched_leads' not in st.session_state:
         st.session_state.enriched_leads = []
+    if 'enrichment_run' not in st.session_state:
+        st.session_state.enrichment_run = None  # Unique token per enrichment run, used as a cache key
     if 'report' not in st.session_state:
         st.session_state.report = None
     if 'show_tutorial' not in st.session_state:
@@ -73,6 +94,8 @@ def init_session_state():
 
 def render_header():
     """Render application header"""
+    # Streamlit drops elements that aren't re-emitted, so the style block is sent on every run
+    st.markdown(CUSTOM_CSS, unsafe_allow_html=True)
     st.markdown('<h1 class="main-header">🎯 AcquireIQ</h1>', unsafe_allow_html=True)
     st.markdown("**Enterprise Contact Enrichment for M&A Searchers**")
     st.markdown("---")
@@ -87,7 +110,7 @@ def render_tutorial():
             
             **Get started in 3 easy steps:**
             
-            1. **Configure API Key** (Sidebar) - Your Hunter.io key is pre-filled
+            1. **Configure API Key** (Sidebar) - Pre-filled from `HUNTER_API_KEY` in your `.env`
             2. **Choose Data Source** (Sidebar):
                - 🎲 Sample Data - Try it instantly with 10 demo leads
                - 🔍 Domain Search - Find contacts at any company (e.g., stripe.com)
@@ -121,7 +144,7 @@ def render_sidebar():
         # Hunter.io API Key input
         api_key = st.text_input(
             "Hunter.io API Key",
-            value="00d17a35bfef2423200768ddecf7d27fc9dc9ca6",
+            value=settings.hunter_api_key or "",
             type="password",
             help="Get free 50 credits/month at https://hunter.io"
         )
@@ -195,11 +218,12 @@ def render_metrics(enriched_leads: list):
     if not enriched_leads:
         return
     
-    # Calculate metrics
-    total = len(enriched_leads)
-    verified = sum(1 for lead in enriched_leads if lead.email_status == EmailStatus.VALID)
-    high_conf = sum(1 for lead in enriched_leads if lead.email_confidence and lead.email_confidence >= 90)
-    avg_quality = sum(lead.data_quality_score for lead in enriched_leads) / total if total > 0 else 0
+    # Calculate metrics from the cached lead frame
+    leads_df = build_leads_frame(st.session_state.enrichment_run, enriched_leads)
+    total = len(leads_df)
+    verified = int(leads_df['status'].eq("VALID").sum())
+    high_conf = int(leads_df['confidence'].ge(90).sum())
+    avg_quality = float(leads_df['quality'].mean()) if total > 0 else 0
     
     # Display metrics
     col1, col2, col3, col4 = st.columns(4)
@@ -217,13 +241,37 @@ def render_metrics(enriched_leads: list):
         st.metric("Avg Quality Score", f"{avg_quality:.1f}/100")
 
 
+@st.cache_data(show_spinner=False, max_entries=16)
+def build_status_pie(status_counts: tuple):
+    """Email status pie chart for (status, count) pairs"""
+    return px.pie(
+        values=[count for _, count in status_counts],
+        names=[status for status, _ in status_counts],
+        title="Email Status Distribution",
+        color_discrete_sequence=px.colors.sequential.RdBu
+    )
+
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def build_quality_histogram(quality_scores: tuple):
+    """Data quality score histogram"""
+    return px.histogram(
+        pd.DataFrame({'data_quality_score': quality_scores}),
+        x='data_quality_score',
+        nbins=20,
+        title="Data Quality Score Distribution",
+        labels={'data_quality_score': 'Quality Score', 'count': 'Number of Leads'},
+        color_discrete_sequence=['#667eea']
+    )
+
+
 def render_charts(enriched_leads: list):
     """Render visualization charts"""
     if not enriched_leads:
         return
     
     # Prepare data
-    df = pd.DataFrame([lead.dict() for lead in enriched_leads])
+    df = build_lead_records_frame(st.session_state.enrichment_run, enriched_leads)
     
     col1, col2 = st.columns(2)
     
@@ -231,38 +279,153 @@ def render_charts(enriched_leads: list):
         # Email Status Distribution
         st.subheader("📊 Email Verification Status")
         status_counts = df['email_status'].value_counts()
-        fig_status = px.pie(
-            values=status_counts.values,
-            names=status_counts.index,
-            title="Email Status Distribution",
-            color_discrete_sequence=px.colors.sequential.RdBu
-        )
+        # Figures are cached on their plotted data, so identical distributions reuse the figure
+        fig_status = build_status_pie(tuple((status_value(s), int(c)) for s, c in status_counts.items()))
         st.plotly_chart(fig_status, use_container_width=True)
     
     with col2:
         # Data Quality Distribution
         st.subheader("📈 Data Quality Scores")
-        fig_quality = px.histogram(
-            df,
-            x='data_quality_score',
-            nbins=20,
-            title="Data Quality Score Distribution",
-            labels={'data_quality_score': 'Quality Score', 'count': 'Number of Leads'},
-            color_discrete_sequence=['#667eea']
-        )
+        fig_quality = build_quality_histogram(tuple(int(score) for score in df['data_quality_score']))
         st.plotly_chart(fig_quality, use_container_width=True)
 
 
+# Columns of the leads frame shown in the table
+DISPLAY_COLUMNS = ["Name", "Title", "Company", "Email", "Status", "Confidence", "Quality Score", "Location"]
+
+# Colour-marked statuses, so the table needs no per-cell styling
+STATUS_BADGES = {
+    "valid": "🟢 valid",
+    "invalid": "🔴 invalid",
+}
+
+
+def status_value(status) -> str:
+    """Plain string value of an EmailStatus enum or stored status string"""
+    return status.value if hasattr(status, 'value') else str(status or "")
+
+
+
+def status_badge(status: str) -> str:
+    """Status with a colour marker (green valid, red invalid, yellow otherwise) for the table"""
+    if not status:
+        return ""
+    return STATUS_BADGES.get(status.lower(), f"🟡 {status}")
+
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def build_leads_frame(run_id: str, _leads: list) -> pd.DataFrame:
+    """
+    Display and filter columns for the leads table
+    Built once per enrichment run; filter columns hold lowercased search text and upper-case status strings
+    """
+    leads_df = pd.DataFrame({
+        # Table display columns
+        "Name": [lead.full_name or "" for lead in _leads],
+        "Title": [lead.title or "" for lead in _leads],
+        "Company": [lead.company_name or "" for lead in _leads],
+        "Email": [lead.email or "" for lead in _leads],
+        "Status": [status_badge(status_value(lead.email_status)) for lead in _leads],
+        "Confidence": [f"{lead.email_confidence}%" if lead.email_confidence else "N/A" for lead in _leads],
+        "Quality Score": [f"{lead.data_quality_score}/100" for lead in _leads],
+        # Filter columns
+        # Name, company and email lowercased and joined with a separator no search term
+        # can contain, so one substring scan matches any of the three fields
+        "search_text": [
+            f"{lead.full_name or ''}\x00{lead.company_name or ''}\x00{lead.email or ''}".lower()
+            for lead in _leads
+        ],
+        "status": [status_value(lead.email_status).upper() for lead in _leads],
+        "quality": [lead.data_quality_score for lead in _leads],
+        "confidence": pd.Series([lead.email_confidence for lead in _leads], dtype="float64"),
+    })
+    
+    # "City, ST" when both parts are present, as one vectorized pass
+    city = pd.Series([lead.city or "" for lead in _leads], dtype="object")
+    state = pd.Series([lead.state or "" for lead in _leads], dtype="object")
+    leads_df["Location"] = (city + ", " + state).where(city.ne("") & state.ne(""), "N/A")
+    
+    return leads_df
+
+
+# Keys of Lead.to_row, in column order
+LEAD_RECORD_COLUMNS = ["full_name", "email", "email_status", "email_confidence", "data_quality_score", "city", "state"]
+
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def build_lead_records_frame(run_id: str, _leads: list) -> pd.DataFrame:
+    """
+    Lead chart fields as a DataFrame, built once per enrichment run
+    Built column-wise from Lead.to_row dicts, which pandas ingests faster than a list of records
+    """
+    rows = [lead.to_row() for lead in _leads]
+    return pd.DataFrame({column: [row[column] for row in rows] for column in LEAD_RECORD_COLUMNS})
+
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def compute_analytics(run_id: str, _leads: list) -> dict:
+    """
+    Analytics tab statistics, computed once per enrichment run
+    Confidence buckets only count leads with a non-zero confidence
+    """
+    leads_df = build_leads_frame(run_id, _leads)
+    
+    # One value_counts / pd.cut pass per statistic
+    status_counts = leads_df['status'].value_counts()
+    confidence = leads_df['confidence']
+    conf_counts = pd.cut(
+        confidence[confidence > 0], [0, 70, 90, float('inf')],
+        right=False, labels=['low', 'medium', 'high']
+    ).value_counts()
+    quality_counts = pd.cut(
+        leads_df['quality'], [float('-inf'), 60, 80, float('inf')],
+        right=False, labels=['fair', 'good', 'excellent']
+    ).value_counts()
+    
+    status_breakdown = [(s.value, int(status_counts.get(s.value.upper(), 0))) for s in EmailStatus]
+    
+    return {
+        "total": len(leads_df),
+        "status_counts": [(name, count) for name, count in status_breakdown if count > 0],
+        "high": int(conf_counts['high']),
+        "medium": int(conf_counts['medium']),
+        "low": int(conf_counts['low']),
+        "excellent": int(quality_counts['excellent']),
+        "good": int(quality_counts['good']),
+        "fair": int(quality_counts['fair']),
+    }
+
+
+# CRMIntegration method for each export format
+CRM_EXPORT_METHODS = {
+    "generic": "export_generic_crm_format",
+    "salesforce": "export_salesforce_format",
+    "hubspot": "export_hubspot_format",
+    "pipedrive": "export_pipedrive_format",
+}
+
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def build_crm_export(run_id: str, lead_keys: tuple, export_format: str, _leads: list) -> bytes:
+    """
+    Build one CRM export CSV for a set of leads
+    Cached on the enrichment run and lead identities so repeated downloads skip rebuilding
+    """
+    exporter = getattr(get_crm(), CRM_EXPORT_METHODS[export_format])
+    return exporter(_leads).to_csv(index=False).encode('utf-8')
+
+
+@st.fragment
 def render_leads_table(enriched_leads: list):
-    """Render enriched leads table with filtering and CRM export"""
-    if not enriched_leads:
-        st.info("No leads to display. Generate or upload leads to get started.")
-        return
-    
+    """
+    Render enriched leads table with filtering and CRM export
+    Runs as a fragment so search/filter changes rerun only this section
+    Callers only invoke it once there are enriched leads, so no widgets exist before then
+    """
     st.subheader("📋 Enriched Leads")
     
     # Search and Filter Row
-    col_search, col_filter, col_quality = st.columns([2, 1, 1])
+    col_search, col_filter, col_quality, col_rows = st.columns([2, 1, 1, 1])
     
     with col_search:
         search_term = st.text_input("🔍 Search", placeholder="Search by name, company, email...", key="search")
@@ -281,70 +444,46 @@ def render_leads_table(enriched_leads: list):
             key="quality_filter"
         )
     
-    # Apply filters
-    filtered_leads = enriched_leads
+    with col_rows:
+        max_rows = st.number_input(
+            "Rows to display", 100, 5000, 500, step=100,
+            key="max_rows",
+            help="Highest-quality matches are shown first; exports include every match"
+        )
+    
+    # Apply filters as vectorized masks over the per-run lead frame
+    leads_df = build_leads_frame(st.session_state.enrichment_run, enriched_leads)
+    mask = pd.Series(True, index=leads_df.index)
     
     if search_term:
         search_lower = search_term.lower()
-        filtered_leads = [
-            lead for lead in filtered_leads 
-            if search_lower in (lead.full_name or "").lower() 
-            or search_lower in (lead.company_name or "").lower()
-            or search_lower in (lead.email or "").lower()
-        ]
-    
-    # FIXED: Handle EmailStatus enum properly
+        mask &= leads_df['search_text'].str.contains(search_lower, regex=False, na=False)
+    
     if status_filter != "All":
-        filtered_leads = [
-            lead for lead in filtered_leads 
-            if (hasattr(lead.email_status, 'value') and lead.email_status.value == status_filter) or
-               (isinstance(lead.email_status, str) and lead.email_status.upper() == status_filter)
-        ]
-    
-    if quality_filter != "All":
-        if quality_filter == "Excellent (80-100)":
-            filtered_leads = [lead for lead in filtered_leads if lead.data_quality_score >= 80]
-        elif quality_filter == "Good (60-79)":
-            filtered_leads = [lead for lead in filtered_leads if 60 <= lead.data_quality_score < 80]
-        elif quality_filter == "Fair (0-59)":
-            filtered_leads = [lead for lead in filtered_leads if lead.data_quality_score < 60]
+        mask &= leads_df['status'].eq(status_filter)
+    
+    if quality_filter == "Excellent (80-100)":
+        mask &= leads_df['quality'] >= 80
+    elif quality_filter == "Good (60-79)":
+        mask &= leads_df['quality'].between(60, 79)
+    elif quality_filter == "Fair (0-59)":
+        mask &= leads_df['quality'] < 60
+    
+    filtered_leads = [enriched_leads[i] for i in leads_df.index[mask]]
     
     st.write(f"Showing **{len(filtered_leads)}** of **{len(enriched_leads)}** leads")
     
-    # Table display
-    display_data = []
-    for lead in filtered_leads:
-        # FIXED: Display only the enum value, not the full enum name
-        email_status_display = lead.email_status.value if hasattr(lead.email_status, 'value') else str(lead.email_status)
-        
-        display_data.append({
-            "Name": lead.full_name or "",
-            "Title": lead.title or "",
-            "Company": lead.company_name or "",
-            "Email": lead.email or "",
-            "Status": email_status_display,  # Fixed display
-            "Confidence": f"{lead.email_confidence}%" if lead.email_confidence else "N/A",
-            "Quality Score": f"{lead.data_quality_score}/100",
-            "Location": f"{lead.city}, {lead.state}" if lead.city and lead.state else "N/A"
-        })
-    
-    df_display = pd.DataFrame(display_data)
-    
-    # Apply styling
-    def color_status(val):
-        val_str = str(val).upper()
-        if "VALID" in val_str and "INVALID" not in val_str:
-            return 'color: green'
-        elif "INVALID" in val_str:
-            return 'color: red'
-        else:
-            return 'color: orange'
+    # Table display, limited to the top matches by quality score
+    df_display = leads_df[mask].nlargest(int(max_rows), 'quality')[DISPLAY_COLUMNS].reset_index(drop=True)
+    if len(df_display) < len(filtered_leads):
+        st.caption(f"Table limited to the top {len(df_display)} leads by quality score")
     
-    if len(df_display) > 0 and 'Status' in df_display.columns:
-        styled_df = df_display.style.apply(lambda col: [color_status(val) for val in col], subset=['Status'])
-        st.dataframe(styled_df, use_container_width=True, height=400)
-    else:
-        st.dataframe(df_display, use_container_width=True, height=400)
+    st.dataframe(
+        df_display,
+        use_container_width=True,
+        height=400,
+        column_config={"Status": st.column_config.TextColumn(width="small")}
+    )
     
     # Export options
     st.markdown("---")
@@ -352,44 +491,46 @@ def render_leads_table(enriched_leads: list):
     
     export_col1, export_col2, export_col3, export_col4 = st.columns(4)
     
-    crm = CRMIntegration()
+    run_id = st.session_state.enrichment_run
+    lead_keys = tuple(id(lead) for lead in filtered_leads)
+    
+    def export_data(export_format: str):
+        """Deferred CSV builder; Streamlit only calls it when the button is clicked"""
+        return lambda: build_crm_export(run_id, lead_keys, export_format, filtered_leads)
+    
     timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
     
     with export_col1:
-        generic_csv = crm.export_generic_crm_format(filtered_leads).to_csv(index=False).encode('utf-8')
         st.download_button(
             label="📄 Generic CSV",
-            data=generic_csv,
+            data=export_data("generic"),
             file_name=f"acquireiq_leads_{timestamp}.csv",
             mime="text/csv",
             use_container_width=True
         )
     
     with export_col2:
-        sf_csv = crm.export_salesforce_format(filtered_leads).to_csv(index=False).encode('utf-8')
         st.download_button(
             label="☁️ Salesforce",
-            data=sf_csv,
+            data=export_data("salesforce"),
             file_name=f"salesforce_import_{timestamp}.csv",
             mime="text/csv",
             use_container_width=True
         )
     
     with export_col3:
-        hs_csv = crm.export_hubspot_format(filtered_leads).to_csv(index=False).encode('utf-8')
         st.download_button(
             label="🟠 HubSpot",
-            data=hs_csv,
+            data=export_data("hubspot"),
             file_name=f"hubspot_import_{timestamp}.csv",
             mime="text/csv",
             use_container_width=True
         )
     
     with export_col4:
-        pd_csv = crm.export_pipedrive_format(filtered_leads).to_csv(index=False).encode('utf-8')
         st.download_button(
             label="🟢 Pipedrive",
-            data=pd_csv,
+            data=export_data("pipedrive"),
             file_name=f"pipedrive_import_{timestamp}.csv",
             mime="text/csv",
             use_container_width=True
@@ -406,9 +547,16 @@ def main():
     config = render_sidebar()
     
     # Main content area
-    tab1, tab2, tab3 = st.tabs(["🚀 Enrichment", "📊 Analytics", "ℹ️ About"])
-    
-    with tab1:
+    # Radio instead of st.tabs so only the selected view is rendered on each rerun
+    active_view = st.radio(
+        "View",
+        ["🚀 Enrichment", "📊 Analytics", "ℹ️ About"],
+        horizontal=True,
+        label_visibility="collapsed",
+        key="active_view"
+    )
+    
+    if active_view == "🚀 Enrichment":
         st.header("Contact Enrichment Pipeline")
         
         col1, col2 = st.columns([3, 1])
@@ -429,7 +577,7 @@ def main():
         with col2:
             if st.button("🚀 Start Enrichment", type="primary", use_container_width=True):
                 with st.spinner("Fetching leads and enriching contacts... This may take a moment."):
-                    scraper = LeadScraper()
+                    scraper = get_scraper()
                     leads = []
                     source = config.get("source")
                     
@@ -472,7 +620,8 @@ def main():
                                 leads = scraper.bulk_domain_search(
                                     domains, 
                                     config.get('api_key') or "", 
-                                    config.get('max_per_domain', 10)
+                                    config.get('max_per_domain', 10),
+                                    rate_limiter=get_enricher(config.get('api_key') or "").rate_limiter
                                 )
                             st.success(f"✅ Retrieved {len(leads)} total leads from {len(domains)} domains")
                         except Exception as e:
@@ -506,20 +655,27 @@ def main():
                     st.session_state.leads = leads
                     
                     # Enrichment
-                    enricher = ContactEnricher(api_key=config['api_key'])
-                    enriched = []
+                    enricher = get_enricher(config['api_key'])
+                    enriched = [None] * len(leads)
                     progress_bar = st.progress(0)
                     status_text = st.empty()
                     
-                    for i, lead in enumerate(leads):
-                        status_text.text(f"Enriching {i+1}/{len(leads)}: {lead.company_name or 'Unknown'}...")
-                        enriched_lead = enricher.enrich_lead(lead)
-                        enriched.append(enriched_lead)
-                        progress_bar.progress((i + 1) / len(leads))
-                        time.sleep(0.05)  # Faster processing
+                    # Lookups are I/O-bound; run them concurrently (paced by the enricher's rate limiter)
+                    with ThreadPoolExecutor(max_workers=settings.max_concurrent_requests) as pool:
+                        futures = {pool.submit(enricher.enrich_lead, lead): idx for idx, lead in enumerate(leads)}
+                        
+                        # Refresh the progress widgets ~20 times per run rather than once per lead
+                        update_every = max(1, len(leads) // 20)
+                        for i, future in enumerate(as_completed(futures)):
+                            idx = futures[future]
+                            enriched[idx] = future.result()
+                            if (i + 1) % update_every == 0 or i + 1 == len(leads):
+                                status_text.text(f"Enriched {i+1}/{len(leads)}: {leads[idx].company_name or 'Unknown'}")
+                                progress_bar.progress((i + 1) / len(leads))
                     
                     status_text.empty()
                     st.session_state.enriched_leads = enriched
+                    st.session_state.enrichment_run = uuid.uuid4().hex
                     st.success(f"✅ Successfully enriched {len(enriched)} leads!")
                     st.balloons()
         
@@ -530,8 +686,10 @@ def main():
             render_metrics(st.session_state.enriched_leads)
             st.markdown("---")
             render_leads_table(st.session_state.enriched_leads)
+        else:
+            st.info("No leads to display. Generate or upload leads to get started.")
     
-    with tab2:
+    elif active_view == "📊 Analytics":
         st.header("Enrichment Analytics")
         
         if st.session_state.enriched_leads:
@@ -540,23 +698,20 @@ def main():
             # Detailed statistics
             st.subheader("📈 Detailed Statistics")
             
-            enriched = st.session_state.enriched_leads
+            stats = compute_analytics(st.session_state.enrichment_run, st.session_state.enriched_leads)
+            total = stats["total"]
             
             col1, col2, col3 = st.columns(3)
             
             with col1:
                 st.markdown("**Email Status Breakdown**")
-                for status in EmailStatus:
-                    count = sum(1 for lead in enriched if lead.email_status == status)
-                    if count > 0:
-                        percentage = (count / len(enriched)) * 100
-                        st.write(f"- {status.value}: {count} ({percentage:.1f}%)")
+                for status_name, count in stats["status_counts"]:
+                    percentage = (count / total) * 100
+                    st.write(f"- {status_name}: {count} ({percentage:.1f}%)")
             
             with col2:
                 st.markdown("**Confidence Levels**")
-                high = sum(1 for lead in enriched if lead.email_confidence and lead.email_confidence >= 90)
-                medium = sum(1 for lead in enriched if lead.email_confidence and 70 <= lead.email_confidence < 90)
-                low = sum(1 for lead in enriched if lead.email_confidence and lead.email_confidence < 70)
+                high, medium, low = stats["high"], stats["medium"], stats["low"]
                 total_with_conf = high + medium + low
                 if total_with_conf > 0:
                     st.write(f"- High (90-100%): {high} ({high/total_with_conf*100:.1f}%)")
@@ -565,17 +720,15 @@ def main():
             
             with col3:
                 st.markdown("**Quality Scores**")
-                excellent = sum(1 for lead in enriched if lead.data_quality_score >= 80)
-                good = sum(1 for lead in enriched if 60 <= lead.data_quality_score < 80)
-                fair = sum(1 for lead in enriched if lead.data_quality_score < 60)
-                st.write(f"- Excellent (80-100): {excellent} ({excellent/len(enriched)*100:.1f}%)")
-                st.write(f"- Good (60-79): {good} ({good/len(enriched)*100:.1f}%)")
-                st.write(f"- Fair (<60): {fair} ({fair/len(enriched)*100:.1f}%)")
+                excellent, good, fair = stats["excellent"], stats["good"], stats["fair"]
+                st.write(f"- Excellent (80-100): {excellent} ({excellent/total*100:.1f}%)")
+                st.write(f"- Good (60-79): {good} ({good/total*100:.1f}%)")
+                st.write(f"- Fair (<60): {fair} ({fair/total*100:.1f}%)")
         
         else:
             st.info("Run enrichment first to see analytics")
     
-    with tab3:
+    elif active_view == "ℹ️ About":
         st.header("About AcquireIQ")
         
         st.markdown("""
@@ -1,10 +1,79 @@
 """
 Email validation utilities
 """
+import asyncio
+import mmap
 import re
+import select
+import socket
+import time
+import dns.entropy
+import dns.exception
+import dns.flags
+import dns.message
+import dns.rcode
+import dns.rdatatype
 import dns.resolver
-from email_validator import validate_email as validate_email_format, EmailNotValidError
-from typing import Dict, Tuple, List
+from array import array
+from bisect import bisect_left
+from functools import lru_cache
+from typing import Dict, Tuple, List, Optional
+from config import settings
+from cache import BoundedCache
+
+
+# Max domains kept in the MX lookup cache
+MX_CACHE_MAX_SIZE = 4096
+
+# domain -> (expires_at, has_mx, mx_records), shared by all validators in the process
+_mx_cache = BoundedCache(MX_CACHE_MAX_SIZE)
+
+# Max reports kept in the comprehensive_validation cache
+VALIDATION_CACHE_MAX_SIZE = 100_000
+
+# normalized email -> (expires_at, report)
+_validation_cache = BoundedCache(VALIDATION_CACHE_MAX_SIZE)
+
+
+
+class SortedDomainFile:
+    """
+    Domain list read in place from a sorted, newline-delimited file through mmap
+    Lookups binary-search the mapped bytes, so a large list costs no per-entry Python objects
+    """
+    
+    def __init__(self, path: str):
+        with open(path, 'rb') as f:
+            size = f.seek(0, 2)
+            self._data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if size else b''
+        
+        # Start offset of every line, plus a sentinel one past the end
+        self._starts = array('Q', [0])
+        pos = self._data.find(b'\n')
+        while pos != -1:
+            self._starts.append(pos + 1)
+            pos = self._data.find(b'\n', pos + 1)
+        if self._starts[-1] != len(self._data):
+            self._starts.append(len(self._data) + 1)
+    
+    def __len__(self) -> int:
+        return len(self._starts) - 1
+    
+    def _line(self, i: int) -> bytes:
+        return self._data[self._starts[i]:self._starts[i + 1] - 1].rstrip(b'\r')
+    
+    def __contains__(self, domain: str) -> bool:
+        key = domain.encode('utf-8')
+        i = bisect_left(range(len(self)), key, key=self._line)
+        return i < len(self) and self._line(i) == key
+
+
+@lru_cache(maxsize=1)
+def _disposable_domain_file() -> Optional[SortedDomainFile]:
+    """The configured disposable-domain file, opened on first use"""
+    if not settings.disposable_domains_path:
+        return None
+    return SortedDomainFile(settings.disposable_domains_path)
 
 
 class EmailValidator:
@@ -13,18 +82,37 @@ class EmailValidator:
     # Comprehensive email regex pattern
     EMAIL_REGEX = r'^(?!\.)[a-zA-Z0-9.!#$%&\'*+/=?^_`{|}~-]+@[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?(?:\.[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?)*$'
     
+    # Patterns compiled once at class load
+    _EMAIL_RE = re.compile(EMAIL_REGEX)
+    _NONLETTER_BYTES = bytes(c for c in range(128) if not ord('a') <= c <= ord('z'))
+    _VOWEL_BYTES = b'aeiou'
+    
+    # Every rule validate_format enforces, folded into one pattern so valid addresses
+    # are accepted in a single C-level pass; only rejects go on to the step-by-step checks
+    _VALID_EMAIL_BODY = (
+        # Local part, with dots only between other characters
+        r'[a-zA-Z0-9!#$%&\'*+/=?^_`{|}~-]+(?:\.[a-zA-Z0-9!#$%&\'*+/=?^_`{|}~-]+)*@'
+        # Domain labels followed by an alphabetic TLD
+        r'(?:[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?\.)+[a-zA-Z]{2,63}'
+    )
+    # Plus a local part of 1-64 characters and a domain of 1-255
+    _VALID_EMAIL_RE = re.compile(r'(?=[^@]{1,64}@.{1,255}$)' + _VALID_EMAIL_BODY)
+    
+    # Longest possible address: 64-character local part, '@', 255-character domain
+    MAX_EMAIL_LENGTH = 320
+    
     # Disposable email domains
-    DISPOSABLE_DOMAINS = {
+    DISPOSABLE_DOMAINS = frozenset({
         'tempmail.com', 'guerrillamail.com', '10minutemail.com',
         'throwaway.email', 'maildrop.cc', 'mailinator.com',
         'trashmail.com', 'yopmail.com', 'temp-mail.org'
-    }
+    })
     
     # Common webmail providers
-    WEBMAIL_PROVIDERS = {
+    WEBMAIL_PROVIDERS = frozenset({
         'gmail.com', 'yahoo.com', 'outlook.com', 'hotmail.com',
         'icloud.com', 'aol.com', 'protonmail.com', 'mail.com'
-    }
+    })
     
     @classmethod
     def validate_format(cls, email: str) -> Tuple[bool, str]:
@@ -35,17 +123,28 @@ class EmailValidator:
         if not email or not isinstance(email, str):
             return False, "Email is empty or invalid type"
         
-        email = email.strip().lower()
+        return cls._validate_normalized_format(email.strip().lower())
+    
+    @classmethod
+    def _validate_normalized_format(cls, email: str) -> Tuple[bool, str]:
+        """validate_format for an already stripped and lowercased address"""
+        # Bound the input before any backtracking regex runs on it
+        if len(email) > cls.MAX_EMAIL_LENGTH:
+            return False, f"Email must be at most {cls.MAX_EMAIL_LENGTH} characters"
+        
+        # Fast path for well-formed addresses
+        if cls._VALID_EMAIL_RE.fullmatch(email):
+            return True, "Valid format"
         
         # Basic regex check
-        if not re.match(cls.EMAIL_REGEX, email):
+        if not cls._EMAIL_RE.match(email):
             return False, "Invalid email format"
         
         # Check for common mistakes
         if email.count('@') != 1:
             return False, "Email must contain exactly one @ symbol"
         
-        local, domain = email.split('@')
+        local, _, domain = email.partition('@')
         
         # Local part checks
         if len(local) == 0 or len(local) > 64:
@@ -61,7 +160,10 @@ class EmailValidator:
         if len(domain) == 0 or len(domain) > 255:
             return False, "Domain length must be 1-255 characters"
         
-        if not re.match(r'^[a-zA-Z0-9-]+(\.[a-zA-Z0-9-]+)*\.[a-zA-Z]{2,}$', domain):
+        # EMAIL_REGEX has already checked every label, so the domain only
+        # needs a dot and an alphabetic TLD of 2+ characters (all ASCII by now)
+        head, dot, tld = domain.rpartition('.')
+        if not dot or len(tld) < 2 or not tld.isalpha():
             return False, "Invalid domain format"
         
         return True, "Valid format"
@@ -72,6 +174,9 @@ class EmailValidator:
         Validate using email-validator library
         Returns detailed validation info
         """
+        # Imported on first use: nothing on the enrichment path needs it, and it costs ~40ms at startup
+        from email_validator import validate_email as validate_email_format, EmailNotValidError
+        
         try:
             validation = validate_email_format(email, check_deliverability=False)
             return {
@@ -90,38 +195,167 @@ class EmailValidator:
                 'error': str(e)
             }
     
+    @staticmethod
+    def _cached_mx(domain: str):
+        """Cached (has_mx, mx_records) for a domain, or None when missing or expired"""
+        entry = _mx_cache.get(domain)
+        if entry is None:
+            return None
+        expires_at, has_mx, mx_records = entry
+        if expires_at < time.monotonic():
+            _mx_cache.pop(domain, None)
+            return None
+        return has_mx, list(mx_records)
+    
+    @staticmethod
+    def _store_mx(domain: str, has_mx: bool, mx_list: List[str]) -> Tuple[bool, List[str]]:
+        """Cache a definitive MX answer for mx_cache_ttl seconds and return it"""
+        _mx_cache.put(domain, (time.monotonic() + settings.mx_cache_ttl, has_mx, tuple(mx_list)))
+        return has_mx, mx_list
+    
     @classmethod
     def check_mx_records(cls, domain: str) -> Tuple[bool, List[str]]:
         """
         Check if domain has valid MX records
+        Answers and non-existent domains are cached; resolver failures are retried next call
         Returns: (has_mx, mx_records)
         """
+        cached = cls._cached_mx(domain)
+        if cached is not None:
+            return cached
+        
         try:
             mx_records = dns.resolver.resolve(domain, 'MX')
             mx_list = [str(r.exchange) for r in mx_records]
-            return True, mx_list
-        except (dns.resolver.NXDOMAIN, dns.resolver.NoAnswer, dns.resolver.NoNameservers):
+            return cls._store_mx(domain, True, mx_list)
+        except (dns.resolver.NXDOMAIN, dns.resolver.NoAnswer):
+            return cls._store_mx(domain, False, [])
+        except dns.resolver.NoNameservers:
             return False, []
         except Exception as e:
             return False, []
     
+    @classmethod
+    def check_mx_records_bulk(cls, domains: List[str]) -> Dict[str, Tuple[bool, List[str]]]:
+        """
+        Check MX records for many domains, sending every uncached query over one UDP socket
+        Answers are matched back by query id; unanswered, truncated or failed queries
+        fall back to check_mx_records
+        Returns: {domain: (has_mx, mx_records)}
+        """
+        results = {}
+        for domain in domains:
+            cached = cls._cached_mx(domain)
+            if cached is not None:
+                results[domain] = cached
+        
+        pending = [domain for domain in dict.fromkeys(domains) if domain not in results]
+        if pending:
+            try:
+                cls._pipeline_mx_queries(pending, results)
+            except (OSError, IndexError, dns.exception.DNSException):
+                # No usable nameserver, resolver configuration or socket;
+                # the resolver below reports per domain
+                pass
+        
+        for domain in pending:
+            if domain not in results:
+                results[domain] = cls.check_mx_records(domain)
+        
+        return results
+    
+    @classmethod
+    def _pipeline_mx_queries(cls, domains: List[str], results: Dict[str, Tuple[bool, List[str]]]):
+        """Send MX queries for all domains at once to the system nameserver and collect definitive answers"""
+        resolver = dns.resolver.get_default_resolver()
+        nameserver = (resolver.nameservers[0], resolver.port)
+        family = socket.AF_INET6 if ':' in nameserver[0] else socket.AF_INET
+        
+        with socket.socket(family, socket.SOCK_DGRAM) as sock:
+            sock.setblocking(False)
+            
+            # query id -> (domain, query)
+            in_flight = {}
+            for domain in domains:
+                try:
+                    query = dns.message.make_query(domain, 'MX')
+                except Exception:
+                    continue  # Not a valid DNS name; left to check_mx_records
+                while query.id in in_flight:
+                    query.id = dns.entropy.random_16()
+                in_flight[query.id] = (domain, query)
+                sock.sendto(query.to_wire(), nameserver)
+            
+            deadline = time.monotonic() + resolver.lifetime
+            while in_flight:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not select.select([sock], [], [], remaining)[0]:
+                    break
+                
+                data, _ = sock.recvfrom(65535)
+                try:
+                    response = dns.message.from_wire(data)
+                except Exception:
+                    continue
+                entry = in_flight.get(response.id)
+                if entry is None or not entry[1].is_response(response):
+                    continue
+                domain, _ = in_flight.pop(response.id)
+                
+                # Truncated answers and server failures are retried by the regular resolver
+                if response.flags & dns.flags.TC:
+                    continue
+                rcode = response.rcode()
+                if rcode == dns.rcode.NXDOMAIN:
+                    results[domain] = cls._store_mx(domain, False, [])
+                elif rcode == dns.rcode.NOERROR:
+                    mx_list = [
+                        str(r.exchange)
+                        for rrset in response.answer if rrset.rdtype == dns.rdatatype.MX
+                        for r in rrset
+                    ]
+                    results[domain] = cls._store_mx(domain, bool(mx_list), mx_list)
+    
+    @staticmethod
+    def _domain_of(email) -> Optional[str]:
+        """Lowercased text after the last @, or None when there is no @ (or not a string)"""
+        if not isinstance(email, str):
+            return None
+        # One rpartition, and only the domain is lowercased
+        _, at, domain = email.rpartition('@')
+        return domain.lower() if at else None
+    
     @classmethod
     def is_disposable(cls, email: str) -> bool:
-        """Check if email is from disposable provider"""
-        try:
-            domain = email.split('@')[1].lower()
-            return domain in cls.DISPOSABLE_DOMAINS
-        except:
-            return False
+        """
+        Check if email is from disposable provider
+        Subdomains of a listed provider (e.g. foo.mailinator.com) also match
+        """
+        domain = cls._domain_of(email)
+        return domain is not None and cls._is_disposable_domain(domain)
+    
+    @classmethod
+    def _is_disposable_domain(cls, domain: str) -> bool:
+        """
+        is_disposable for an already lowercased domain
+        Checks DISPOSABLE_DOMAINS and, when configured, the disposable_domains_path file
+        """
+        domain_file = _disposable_domain_file()
+        
+        # Test the domain, then each parent domain: one lookup per label
+        while True:
+            if domain in cls.DISPOSABLE_DOMAINS or (domain_file is not None and domain in domain_file):
+                return True
+            dot = domain.find('.')
+            if dot < 0:
+                return False
+            domain = domain[dot + 1:]
     
     @classmethod
     def is_webmail(cls, email: str) -> bool:
         """Check if email is from webmail provider"""
-        try:
-            domain = email.split('@')[1].lower()
-            return domain in cls.WEBMAIL_PROVIDERS
-        except:
-            return False
+        domain = cls._domain_of(email)
+        return domain is not None and domain in cls.WEBMAIL_PROVIDERS
     
     @classmethod
     def detect_gibberish(cls, email: str) -> bool:
@@ -129,31 +363,32 @@ class EmailValidator:
         Detect if email looks like gibberish
         Simple heuristic: check for excessive consonants
         """
-        try:
-            local_part = email.split('@')[0].lower()
-            
-            # Remove numbers and special chars
-            letters_only = re.sub(r'[^a-z]', '', local_part)
-            
-            if len(letters_only) < 3:
-                return False
-            
-            # Count consonants
-            vowels = set('aeiou')
-            consonants = sum(1 for c in letters_only if c not in vowels)
-            
-            # If more than 70% consonants, likely gibberish
-            consonant_ratio = consonants / len(letters_only)
-            
-            return consonant_ratio > 0.7
-        except:
+        if not isinstance(email, str):
             return False
+        return cls._is_gibberish_local(email.partition('@')[0].lower())
     
     @classmethod
-    def comprehensive_validation(cls, email: str) -> Dict:
+    def _is_gibberish_local(cls, local_part: str) -> bool:
+        """detect_gibberish for an already lowercased local part"""
+        # Remove numbers, special chars and non-ASCII with table-driven deletes instead of a regex
+        letters_only = local_part.encode('ascii', 'ignore').translate(None, cls._NONLETTER_BYTES)
+        
+        if len(letters_only) < 3:
+            return False
+        
+        # Count consonants by deleting vowels in one more table-driven C pass
+        consonants = len(letters_only.translate(None, cls._VOWEL_BYTES))
+        
+        # If more than 70% consonants, likely gibberish
+        consonant_ratio = consonants / len(letters_only)
+        
+        return consonant_ratio > 0.7
+    
+    @classmethod
+    def _start_validation(cls, email: str) -> Tuple[Dict, str]:
         """
-        Run all validation checks
-        Returns comprehensive validation report
+        Validation report with the format check and domain filled in, plus the local part
+        'domain' stays None when the email fails before the MX lookup
         """
         result = {
             'email': email,
@@ -167,46 +402,214 @@ class EmailValidator:
             'errors': []
         }
         
-        # Format validation
-        format_valid, error_msg = cls.validate_format(email)
+        # Format validation, normalizing the address once for every later check
+        if not email or not isinstance(email, str):
+            format_valid, error_msg = cls.validate_format(email)
+        else:
+            normalized = email.strip().lower()
+            format_valid, error_msg = cls._validate_normalized_format(normalized)
         result['format_valid'] = format_valid
         
         if not format_valid:
             result['errors'].append(error_msg)
-            return result
-        
-        # Extract domain
-        try:
-            result['domain'] = email.split('@')[1].lower()
-        except:
-            result['errors'].append("Cannot extract domain")
-            return result
+            return result, ""
         
+        # A valid format has exactly one @
+        local, _, result['domain'] = normalized.partition('@')
+        return result, local
+    
+    @classmethod
+    def _domain_checks(cls, domain: str) -> Tuple[bool, bool]:
+        """(is_disposable, is_webmail) for a lowercased domain"""
+        return cls._is_disposable_domain(domain), domain in cls.WEBMAIL_PROVIDERS
+    
+    @staticmethod
+    def _apply_domain_checks(result: Dict, checks: Tuple[bool, bool]):
+        """Record _domain_checks results on a started report; these run before any DNS lookup"""
+        result['is_disposable'], result['is_webmail'] = checks
+        if result['is_disposable']:
+            result['errors'].append("Disposable email detected")
+    
+    @staticmethod
+    def _needs_mx_lookup(result: Dict) -> bool:
+        """
+        Whether a started report still needs an MX lookup
+        Disposable addresses are rejected without one, and webmail providers always have MX
+        """
+        return result['domain'] is not None and not result['is_disposable'] and not result['is_webmail']
+    
+    @classmethod
+    def _finish_validation(cls, result: Dict, local: str, has_mx: bool) -> Dict:
+        """Fill in the checks that follow the MX lookup and the overall verdict"""
         # MX records check
-        has_mx, mx_list = cls.check_mx_records(result['domain'])
         result['mx_records'] = has_mx
         if not has_mx:
             result['errors'].append("No MX records found")
         
-        # Disposable check
-        result['is_disposable'] = cls.is_disposable(email)
-        if result['is_disposable']:
-            result['errors'].append("Disposable email detected")
-        
-        # Webmail check
-        result['is_webmail'] = cls.is_webmail(email)
-        
         # Gibberish check
-        result['is_gibberish'] = cls.detect_gibberish(email)
+        result['is_gibberish'] = cls._is_gibberish_local(local)
         if result['is_gibberish']:
             result['errors'].append("Email appears to be gibberish")
         
         # Overall validity
         result['is_valid'] = (
-            format_valid and 
+            result['format_valid'] and 
             has_mx and 
             not result['is_disposable'] and 
             not result['is_gibberish']
         )
         
         return result
+    
+    @classmethod
+    def comprehensive_validation(cls, email: str) -> Dict:
+        """
+        Run all validation checks
+        Reports are reused for the same normalized address until the MX cache TTL passes
+        Returns comprehensive validation report
+        """
+        if not isinstance(email, str):
+            return cls._comprehensive_validation_uncached(email)
+        
+        key = email.strip().lower()
+        entry = _validation_cache.get(key)
+        if entry is not None and entry[0] >= time.monotonic():
+            return dict(entry[1], email=email, errors=list(entry[1]['errors']))
+        
+        result = cls._comprehensive_validation_uncached(email)
+        
+        # Skip caching a report whose MX lookup failed transiently (and so was not cached either)
+        if not cls._needs_mx_lookup(result) or result['domain'] in _mx_cache:
+            _validation_cache.put(key, (
+                time.monotonic() + settings.mx_cache_ttl, dict(result, errors=list(result['errors']))
+            ))
+        return result
+    
+    @classmethod
+    def _comprehensive_validation_uncached(cls, email: str) -> Dict:
+        """comprehensive_validation without the report cache"""
+        result, local = cls._start_validation(email)
+        if result['domain'] is None:
+            return result
+        
+        cls._apply_domain_checks(result, cls._domain_checks(result['domain']))
+        if result['is_disposable']:
+            return result
+        
+        if cls._needs_mx_lookup(result):
+            has_mx, mx_list = cls.check_mx_records(result['domain'])
+        else:
+            has_mx = True
+        return cls._finish_validation(result, local, has_mx)
+    
+    @classmethod
+    async def comprehensive_validation_many(cls, emails: List[str]) -> List[Dict]:
+        """
+        Run all validation checks for a batch of emails
+        Provider checks and MX lookups run once per distinct domain, with all MX queries
+        in flight together on one socket; only non-disposable, non-webmail domains are resolved
+        Returns one report per email, in input order
+        """
+        started = [cls._start_validation(email) for email in emails]
+        
+        domains = dict.fromkeys(result['domain'] for result, _ in started if result['domain'] is not None)
+        checks_by_domain = {domain: cls._domain_checks(domain) for domain in domains}
+        lookup_domains = [
+            domain for domain, (is_disposable, is_webmail) in checks_by_domain.items()
+            if not is_disposable and not is_webmail
+        ]
+        lookups = await asyncio.to_thread(cls.check_mx_records_bulk, lookup_domains)
+        
+        for result, local in started:
+            domain = result['domain']
+            if domain is None:
+                continue
+            cls._apply_domain_checks(result, checks_by_domain[domain])
+            if not result['is_disposable']:
+                has_mx = lookups[domain][0] if domain in lookups else True  # webmail
+                cls._finish_validation(result, local, has_mx)
+        
+        return [result for result, _ in started]
+    
+    @classmethod
+    def validate_many(cls, emails: List[str]) -> List[Dict]:
+        """
+        Synchronous entry point for comprehensive_validation_many
+        Must not be called from a running event loop
+        """
+        return asyncio.run(cls.comprehensive_validation_many(emails))
+    
+    @classmethod
+    def validate_batch(cls, emails, check_mx: bool = False):
+        """
+        Format, disposable, webmail and gibberish checks for a whole batch at once
+        Runs pyarrow compute kernels over the column instead of one Python call per email
+        With check_mx, distinct domains that are neither disposable nor webmail are resolved
+        in one bulk lookup, adding the mx_records and is_valid columns
+        Returns a pandas DataFrame with one row per email and the matching report columns
+        """
+        import pandas as pd
+        import pyarrow as pa
+        import pyarrow.compute as pc
+        
+        emails = list(emails)
+        # Normalize with Python's str semantics, then work on one Arrow string array
+        normalized = pa.array(
+            [e.strip().lower() if isinstance(e, str) else None for e in emails], type=pa.string()
+        )
+        
+        # Same rules as _VALID_EMAIL_RE; Arrow's regex engine has no lookahead,
+        # so the length limits are checked on the '@' position instead
+        at = pc.find_substring(normalized, '@')
+        domain_length = pc.subtract(pc.subtract(pc.utf8_length(normalized), at), 1)
+        format_valid = pc.fill_null(pc.and_(
+            pc.match_substring_regex(normalized, f'^{cls._VALID_EMAIL_BODY}$'),
+            pc.and_(pc.less_equal(at, 64), pc.less_equal(domain_length, 255))
+        ), False)
+        
+        # Valid addresses have exactly one '@'
+        parts = pc.split_pattern(pc.if_else(format_valid, normalized, None), '@', max_splits=1)
+        local = pc.list_element(parts, 0)
+        domain = pc.list_element(parts, 1)
+        
+        # Per-domain work runs once per distinct domain
+        unique_domains = [d for d in pc.unique(domain).to_pylist() if d is not None]
+        disposable = [d for d in unique_domains if cls._is_disposable_domain(d)]
+        is_disposable = pc.is_in(domain, value_set=pa.array(disposable, type=pa.string()))
+        is_webmail = pc.is_in(domain, value_set=pa.array(sorted(cls.WEBMAIL_PROVIDERS), type=pa.string()))
+        
+        # Same consonant ratio as _is_gibberish_local; like comprehensive_validation,
+        # disposable addresses are not checked further
+        is_disposable = pc.fill_null(is_disposable, False)
+        letters = pc.replace_substring_regex(pc.if_else(is_disposable, None, local), '[^a-z]', '')
+        letter_count = pc.utf8_length(letters)
+        consonant_count = letter_count
+        for vowel in 'aeiou':
+            consonant_count = pc.subtract(consonant_count, pc.count_substring(letters, vowel))
+        consonant_ratio = pc.divide(pc.cast(consonant_count, pa.float64()), pc.cast(letter_count, pa.float64()))
+        is_gibberish = pc.fill_null(pc.and_(
+            pc.greater_equal(letter_count, 3), pc.greater(consonant_ratio, 0.7)
+        ), False)
+        
+        frame = pd.DataFrame({
+            'email': pd.Series(emails, dtype=object),
+            'format_valid': format_valid.to_numpy(zero_copy_only=False),
+            'domain': pd.Series(domain.to_pylist(), dtype=object),
+            'is_disposable': is_disposable.to_numpy(zero_copy_only=False),
+            'is_webmail': pc.fill_null(is_webmail, False).to_numpy(zero_copy_only=False),
+            'is_gibberish': is_gibberish.to_numpy(zero_copy_only=False),
+        })
+        
+        if check_mx:
+            # As in comprehensive_validation: disposable domains get no lookup, webmail is assumed to have MX
+            skip = set(disposable) | cls.WEBMAIL_PROVIDERS
+            lookups = cls.check_mx_records_bulk([d for d in unique_domains if d not in skip])
+            with_mx = [d for d, (has_mx, _) in lookups.items() if has_mx] + sorted(cls.WEBMAIL_PROVIDERS)
+            has_mx = pc.fill_null(pc.is_in(domain, value_set=pa.array(with_mx, type=pa.string())), False)
+            
+            frame['mx_records'] = has_mx.to_numpy(zero_copy_only=False) & ~frame['is_disposable']
+            frame['is_valid'] = (
+                frame['format_valid'] & frame['mx_records'] & ~frame['is_disposable'] & ~frame['is_gibberish']
+            )
+        
+        return frame